@@ -1556,12 +1556,15 @@ class GameLogModule(BaseModule):
             if not self.data_file.exists():
                 self.log_info("No existing game log data file found")
                 return
+            # The migration check validates the store; its result is reused below
+            validated: List[Tuple[int, Any]] = []
             try:
                 outcome = migrate_game_log_store(
                     self.data_file,
                     validator=GameLogValidator,
                     target_version=GameLogValidator.CURRENT_VERSION,
                     logger=self._logger,
+                    on_validated=lambda *result: validated.append(result),
                 )
             except MigrationError as exc:
                 self.log_error("Failed to migrate game log data", exception=exc)
@@ -1578,10 +1581,13 @@ class GameLogModule(BaseModule):
                     new_version=outcome.new_version,
                     backup=str(outcome.backup_path) if outcome.backup_path else None,
                 )
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                raw_data = json.load(f)
             try:
-                schema_version, validated_entries = GameLogValidator.validate_document(raw_data)
+                if validated:
+                    schema_version, validated_entries = validated[0]
+                else:  # pragma: no cover - the migration validates existing files
+                    with open(self.data_file, 'r', encoding='utf-8') as f:
+                        raw_data = json.load(f)
+                    schema_version, validated_entries = GameLogValidator.validate_document(raw_data)
             except GameLogValidationError as e:
                 self.log_error("Game log validation failed", exception=e)
                 self.error_occurred.emit(
@@ -1688,10 +1694,11 @@ class GameLogModule(BaseModule):
         if self.export_thread and self.export_thread.isRunning():
             self.export_thread.quit()
             self.export_thread.wait()
-        # Save current data
-        self.save_data()
         super().cleanup()
         self.log_info("Game log module cleaned up")
+    def cleanup_io(self):
+        """Save current data during shutdown."""
+        self.save_data()
     def get_display_name(self) -> str:
         """Return the display name for this module."""
         return "Game Log"
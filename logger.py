@@ -125,8 +125,14 @@ class HuntProLogger:
         error_handler.setFormatter(StructuredFormatter(include_json=True))
         self.logger.addHandler(error_handler)
     def _log(self, level: int, message: str, category: Optional[LogCategory] = None, 
-             exception: Optional[Exception] = None, **kwargs):
-        """Internal logging method with enhanced features."""
+             exception: Optional[Exception] = None, args: tuple = (), **kwargs):
+        """Internal logging method with enhanced features.
+
+        ``args`` are merged into ``message`` with ``%`` formatting only when the
+        record is emitted, so disabled levels never build the final string.
+        """
+        if not self.logger.isEnabledFor(level):
+            return
         if category is None:
             category_name = 'GENERAL'
         elif isinstance(category, LogCategory):
@@ -146,9 +152,9 @@ class HuntProLogger:
                 extra[f'field_{key}'] = value
         # Create log record
         if exception:
-            self.logger.log(level, message, exc_info=(type(exception), exception, exception.__traceback__), extra=extra)
+            self.logger.log(level, message, *args, exc_info=(type(exception), exception, exception.__traceback__), extra=extra)
         else:
-            self.logger.log(level, message, extra=extra)
+            self.logger.log(level, message, *args, extra=extra)
     def trace(self, message: str, category: Optional[LogCategory] = None, **kwargs):
         """Log trace message (most detailed debugging info)."""
         self._log(LogLevel.TRACE.value, message, category, **kwargs)
@@ -268,6 +274,13 @@ class HuntProLogger:
     def get_session_id(self) -> str:
         """Get the current session ID."""
         return self.session_id
+    def is_enabled_for(self, level: Union[str, int, LogLevel]) -> bool:
+        """Check whether a message at ``level`` would be processed."""
+        if isinstance(level, LogLevel):
+            level = level.value
+        elif isinstance(level, str):
+            level = getattr(logging, level.upper())
+        return self.logger.isEnabledFor(level)
     def set_log_level(self, level: Union[str, int, LogLevel]):
         """Set the logging level."""
         if isinstance(level, LogLevel):
@@ -7,122 +7,253 @@ game logging, environmental tools, and advanced field equipment integration.
 import sys
 import os
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Any
 import importlib
+import queue
+import re
+import time
 import traceback
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from functools import lru_cache
+from types import MappingProxyType
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QPushButton, QLabel, QStatusBar, QMessageBox,
     QSplashScreen, QSystemTrayIcon, QMenu, QFrame, QScrollArea,
     QDialog, QFormLayout, QGroupBox, QDialogButtonBox, QLineEdit,
-    QCheckBox, QComboBox, QSpinBox
+    QCheckBox, QComboBox, QSpinBox, QTextEdit, QDoubleSpinBox, QProgressBar
 )
 from PySide6.QtCore import (
-    Qt, Signal, QTimer, QThread, QObject, QSettings,
-    QPropertyAnimation, QEasingCurve, QRect, QSize
+    Qt, Signal, Slot, QTimer, QThread, QObject, QSettings, QEvent, QRunnable, QThreadPool,
+    QPropertyAnimation, QEasingCurve, QRect, QSize, QSignalBlocker
 )
 from PySide6.QtGui import (
     QFont, QPixmap, QPalette, QColor, QIcon, QAction,
-    QPainter, QLinearGradient
+    QPainter, QLinearGradient, QPixmapCache
 )
 # Import our modules
-from logger import get_logger, setup_logger, LoggableMixin
-from keyboard import VirtualKeyboardManager
-from numpad import VirtualNumpadManager
-from config_validation import validate_configuration, ValidationIssue
+from logger import get_logger, setup_logger, LoggableMixin, LogLevel
+from settings_cache import CachedSettings
+from profile_presets import PROFILE_PRESETS, PROFILE_PRESET_MAP, ProfilePreset, match_profile_preset
+# Validation and the virtual input widgets are imported where they are first
+# used so they are not loaded before the splash screen is up.
+if TYPE_CHECKING:
+    from config_validation import ValidationIssue
 
-# ---------------------------------------------------------------------------
-# Profile presets
-# ---------------------------------------------------------------------------
+# Feature modules are imported by name at runtime, so make sure this directory
+# is importable once at load time rather than on every ModuleManager creation.
+_MODULE_DIR = str(Path(__file__).resolve().parent)
+if _MODULE_DIR not in sys.path:
+    sys.path.insert(0, _MODULE_DIR)
 
-PROFILE_PRESETS = [
-    {
-        "key": "mountain_marksman",
-        "title": "Mountain Marksman",
-        "description": (
-            "North American big-game preset with resilient offline navigation, "
-            "long retention for harvest logs, and a balanced visual setup."
-        ),
-        "general": {
-            "primary_region": "North America",
-            "log_retention": 90,
-            "auto_backup": True,
-            "prompt_before_sync": True,
-            "launch_on_start": True,
-            "show_tips": False,
-        },
-        "display": {
-            "theme": "Dark",
-            "font_scale": 105,
-            "high_contrast": True,
-            "distance_units": "Imperial (yards)",
-            "temperature_units": "Fahrenheit",
-        },
-        "modules": {
-            "ballistics": True,
-            "nav_map": True,
-            "game_log": True,
-        },
-    },
-    {
-        "key": "euro_stalker",
-        "title": "European Stalker",
-        "description": (
-            "Optimized for roaming hunts across European forests with metric "
-            "units and streamlined startup modules."
-        ),
-        "general": {
-            "primary_region": "Europe",
-            "log_retention": 60,
-            "auto_backup": True,
-            "prompt_before_sync": False,
-            "launch_on_start": False,
-            "show_tips": True,
-        },
-        "display": {
-            "theme": "Auto",
-            "font_scale": 100,
-            "high_contrast": False,
-            "distance_units": "Metric (meters)",
-            "temperature_units": "Celsius",
-        },
-        "modules": {
-            "ballistics": True,
-            "nav_map": True,
-            "game_log": False,
-        },
-    },
-    {
-        "key": "savanna_outfitter",
-        "title": "Savanna Outfitter",
-        "description": (
-            "High-visibility preset for guided operations in African reserves "
-            "with aggressive backups and enhanced mapping."
-        ),
-        "general": {
-            "primary_region": "Africa",
-            "log_retention": 45,
-            "auto_backup": True,
-            "prompt_before_sync": True,
-            "launch_on_start": True,
-            "show_tips": True,
-        },
-        "display": {
-            "theme": "Light",
-            "font_scale": 110,
-            "high_contrast": True,
-            "distance_units": "Metric (meters)",
-            "temperature_units": "Celsius",
-        },
-        "modules": {
-            "ballistics": True,
-            "nav_map": True,
-            "game_log": True,
-        },
-    },
-]
+# Result of the (potentially slow) system tray probe, resolved on first use.
+_TRAY_AVAILABLE: Optional[bool] = None
+
+# Fixed choices offered by the settings dialog combo boxes. Interned so they
+# are the same objects as the matching preset values.
+REGION_CHOICES = tuple(map(sys.intern, (
+    'North America', 'South America', 'Europe', 'Africa', 'Asia-Pacific',
+)))
+THEME_CHOICES = tuple(map(sys.intern, ('Dark', 'Light', 'Auto')))
+DISTANCE_UNIT_CHOICES = tuple(map(sys.intern, ('Metric (meters)', 'Imperial (yards)')))
+TEMPERATURE_UNIT_CHOICES = tuple(map(sys.intern, ('Celsius', 'Fahrenheit')))
+@lru_cache(maxsize=None)
+def _choice_indexes(choices: tuple) -> Dict[str, int]:
+    """Return the text -> index map for a combo populated with ``choices``."""
+    return {text: index for index, text in enumerate(choices)}
+
+# The dark theme ships as a standalone Qt stylesheet next to this module.
+THEME_STYLESHEET_PATH = Path(__file__).with_name("theme.qss")
+
+# Rendered splash screen, keyed by version so artwork changes are picked up.
+SPLASH_CACHE_PATH = Path.home() / "HuntPro" / "cache" / "splash-2.0.0.png"
+
+# Modules whose startup loading can be toggled from the settings dialog. Every
+# other module is loaded the first time its tab is opened.
+STARTUP_MODULE_DESCRIPTIONS = {
+    'ballistics': 'Calculates drop charts, wind holds, and rifle profiles for your active weapon systems.',
+    'nav_map': 'Provides offline maps, GPS breadcrumbs, and waypoint management for navigation.',
+    'game_log': 'Captures harvest data, sightings, and tag compliance notes during hunts.'
+}
+
+# Feature modules shown as tabs, listed in load priority order.
+AVAILABLE_MODULES = (
+    (sys.intern('sensor_diagnostics'), {
+        'path': 'sensor_diagnostics_module.SensorDiagnosticsModule',
+        'display_name': 'Sensors',
+        'description': 'Real-time diagnostics and calibration workflows for paired devices',
+        'icon': 'SENS',
+        'priority': 0
+    }),
+    (sys.intern('ballistics'), {
+        'path': 'ballistics.BallisticsModule',
+        'display_name': 'Ballistics',
+        'description': 'Advanced ballistics calculator with environmental corrections',
+        'icon': 'BALL',
+        'priority': 1
+    }),
+    (sys.intern('nav_map'), {
+        'path': 'nav_map.NavigationModule',
+        'display_name': 'Navigation',
+        'description': 'GPS navigation and mapping tools',
+        'icon': 'NAV',
+        'priority': 2
+    }),
+    (sys.intern('game_log'), {
+        'path': 'game_log.GameLogModule',
+        'display_name': 'Game Log',
+        'description': 'Track hunting activities and harvests',
+        'icon': 'LOG',
+        'priority': 3
+    }),
+    (sys.intern('field_tools'), {
+        'path': 'field_tools.FieldToolsModule',
+        'display_name': 'Field Tools',
+        'description': 'Environmental calculations and first aid',
+        'icon': 'FIELD',
+        'priority': 4
+    }),
+    (sys.intern('advanced_tools'), {
+        'path': 'advanced_tools.AdvancedToolsModule',
+        'display_name': 'Advanced Tools',
+        'description': 'RF blocking, night vision, and thermal imaging',
+        'icon': 'ADV',
+        'priority': 5
+    }),
+)
+# Read-only name -> metadata view shared by every ModuleManager. Sorting once
+# here keeps load order tied to 'priority' even if the tuple above is edited
+# out of order; the loaders just iterate this mapping.
+_AVAILABLE_MODULE_MAP = MappingProxyType(
+    dict(sorted(AVAILABLE_MODULES, key=lambda item: item[1]['priority']))
+)
+# (display_name, icon) per module, resolved once for tab construction.
+_MODULE_DISPLAY = MappingProxyType({
+    name: (info['display_name'], info.get('icon', 'TAB'))
+    for name, info in AVAILABLE_MODULES
+})
+# Tab titles, formatted once rather than on every tab swap.
+_MODULE_LABELS = MappingProxyType({
+    name: f"{icon} {display_name}" for name, (display_name, icon) in _MODULE_DISPLAY.items()
+})
+# Widgets that get the virtual keyboard or numpad attached.
+_TEXT_INPUT_TYPES = (QLineEdit, QTextEdit)
+_NUMERIC_INPUT_TYPES = (QSpinBox, QDoubleSpinBox)
+# Process-wide settings store shared by the main window, dialogs, and modules.
+_global_settings: Optional[QSettings] = None
+# Module views onto the shared store; pending changes are written back on quit
+# even when a module's cleanup() never runs (e.g. quitting from the tray).
+_settings_views: "weakref.WeakSet[CachedSettings]" = weakref.WeakSet()
+def get_settings() -> QSettings:
+    """Get the shared application settings instance."""
+    global _global_settings
+    if _global_settings is None:
+        _global_settings = QSettings("HuntPro", "HuntPro")
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(_flush_settings_on_quit)
+    return _global_settings
+def _read_bool(settings: QSettings, key: str, default: bool) -> bool:
+    """Read a boolean without asking QSettings to convert the stored variant."""
+    value = settings.value(key)
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('true', '1')
+def _import_legacy_module_settings(settings: QSettings, module_name: str, group: str):
+    """Copy a module's keys from its pre-shared-store locations into ``group`` once.
+
+    Modules used to keep their values in a separate ``module_<name>`` store and
+    their lifecycle state under ``module_<name>/`` in the main store. Keys
+    already present in ``group`` win; the legacy data is left in place.
+    """
+    marker = f"migrated/module_{module_name}"
+    if _read_bool(settings, marker, False):
+        return
+    legacy = QSettings("HuntPro", f"module_{module_name}")
+    sources = [(key, legacy.value(key)) for key in legacy.allKeys()]
+    legacy_group = f"module_{module_name}"
+    for key in ("initialized", "error_count"):
+        value = settings.value(f"{legacy_group}/{key}")
+        if value is not None:
+            sources.append((key, value))
+    for key, value in sources:
+        target = f"{group}/{key}"
+        if not settings.contains(target):
+            settings.setValue(target, value)
+    settings.setValue(marker, True)
+def _flush_settings_on_quit():
+    """Write back pending module settings and sync the shared store once."""
+    for view in list(_settings_views):
+        view.flush()
+    if _global_settings is not None:
+        _global_settings.sync()
+class SettingsWriter(QThread):
+    """Background thread that persists settings changes off the GUI thread.
 
-PROFILE_PRESET_MAP = {preset["key"]: preset for preset in PROFILE_PRESETS}
+    Changes are queued per settings store and written by QSettings instances
+    owned by this thread. Bursts are coalesced so each key is written once and
+    every touched store is synced once per batch.
+    """
+    _instance: Optional['SettingsWriter'] = None
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self.logger = get_logger()
+    @classmethod
+    def instance(cls) -> 'SettingsWriter':
+        """Return the shared writer, starting it on first use."""
+        if cls._instance is None:
+            writer = cls()
+            app = QApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(writer.shutdown)
+            writer.start()
+            cls._instance = writer
+        return cls._instance
+    def enqueue(self, settings: QSettings, changes: Dict[str, Any]):
+        """Queue ``changes`` for the store backing ``settings``."""
+        if changes:
+            target = (settings.fileName(), settings.format())
+            self._queue.put((target, dict(changes)))
+    def shutdown(self):
+        """Write any queued changes and stop the thread."""
+        if self.isRunning():
+            self._queue.put(None)
+            self.wait()
+        if SettingsWriter._instance is self:
+            SettingsWriter._instance = None
+    def run(self):
+        """Drain the queue until shutdown is requested."""
+        stores: Dict[tuple, QSettings] = {}
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            pending: Dict[tuple, Dict[str, Any]] = {}
+            for item in batch:
+                if item is None:
+                    running = False
+                    continue
+                target, changes = item
+                pending.setdefault(target, {}).update(changes)
+            for target, changes in pending.items():
+                try:
+                    store = stores.get(target)
+                    if store is None:
+                        store = stores[target] = QSettings(*target)
+                    for key, value in changes.items():
+                        store.setValue(key, value)
+                    store.sync()
+                except Exception as e:
+                    self.logger.error(f"Failed to persist settings to {target[0]}", exception=e)
 class BaseModule(QWidget, LoggableMixin):
     """Base class for all Hunt Pro modules."""
     # Enhanced signals
@@ -132,11 +263,14 @@ class BaseModule(QWidget, LoggableMixin):
     info_message = Signal(str)
     progress_updated = Signal(int)  # 0-100
     module_ready = Signal()
+    # Identical consecutive errors inside this window (seconds) are counted
+    # instead of logged individually.
+    ERROR_REPEAT_WINDOW = 1.0
     def __init__(self, parent=None):
         super().__init__(parent)
         LoggableMixin.__init__(self)
         self.module_name = self.__class__.__name__.replace('Module', '')
-        self.settings = QSettings("HuntPro", f"module_{self.module_name}")
+        self._settings: Optional[CachedSettings] = None
         # Maintain backwards compatibility with modules using the legacy
         # ``self.logger`` attribute while also exposing the rich logging
         # helpers provided by :class:`LoggableMixin`.
@@ -145,6 +279,10 @@ class BaseModule(QWidget, LoggableMixin):
         self._initialized = False
         self._error_count = 0
         self._last_error = None
+        self._last_error_key: Optional[str] = None
+        self._error_repeat_count = 0
+        self._last_error_log_ts = 0.0
+        self._virtual_inputs_installed = False
         # Setup base UI properties
         self.setMinimumSize(800, 600)
         self.setAttribute(Qt.WA_AcceptTouchEvents, True)
@@ -157,47 +295,87 @@ class BaseModule(QWidget, LoggableMixin):
             handler = self._default_handle_error
             setattr(self, "_handle_error", handler)
         self.error_occurred.connect(handler)
+    @property
+    def settings_group(self) -> str:
+        """Group holding this module's keys in the shared settings store."""
+        return f"module/{self.module_name}"
+    @property
+    def settings(self) -> CachedSettings:
+        """Module specific view onto the shared application settings."""
+        if self._settings is None:
+            settings = get_settings()
+            _import_legacy_module_settings(settings, self.module_name, self.settings_group)
+            self._settings = CachedSettings(settings, group=self.settings_group)
+            _settings_views.add(self._settings)
+        return self._settings
     def initialize(self) -> bool:
         """Initialize the module. Override in subclasses."""
         try:
             self._initialized = True
             self.logger.info(f"Module {self.module_name} initialized successfully")
-            # Install virtual inputs after initialization
-            QTimer.singleShot(100, self.install_virtual_inputs)
+            # Virtual inputs are installed once the widget tree is polished;
+            # cover modules that were already polished before initializing.
+            if self.testAttribute(Qt.WA_WState_Polished):
+                self._install_virtual_inputs_once()
             self.module_ready.emit()
             return True
         except Exception as e:
             self.logger.error(f"Failed to initialize module {self.module_name}", exception=e)
             self.error_occurred.emit("Initialization Error", str(e))
             return False
+    def event(self, event):
+        """Install virtual inputs when Qt first polishes the module."""
+        # ``getattr`` guards against events delivered while ``__init__`` runs.
+        if event.type() == QEvent.Polish and getattr(self, "_initialized", False):
+            self._install_virtual_inputs_once()
+        return super().event(event)
+    def _install_virtual_inputs_once(self):
+        """Install virtual inputs unless they are already in place."""
+        if self._virtual_inputs_installed:
+            return
+        self._virtual_inputs_installed = True
+        self.install_virtual_inputs()
     def install_virtual_inputs(self):
         """Install virtual keyboard and numpad on appropriate widgets."""
         try:
+            from keyboard import VirtualKeyboardManager
+            from numpad import VirtualNumpadManager
             keyboard_manager = VirtualKeyboardManager.get_instance()
             numpad_manager = VirtualNumpadManager.get_instance()
-            # Install keyboard on text inputs
-            from PySide6.QtWidgets import QLineEdit, QTextEdit
-            for widget in self.findChildren(QLineEdit):
-                keyboard_manager.install_on_widget(widget)
-            for widget in self.findChildren(QTextEdit):
-                keyboard_manager.install_on_widget(widget)
-            # Install numpad on numeric inputs
-            from PySide6.QtWidgets import QSpinBox, QDoubleSpinBox
-            for widget in self.findChildren(QSpinBox):
-                numpad_manager.install_on_widget(widget)
-            for widget in self.findChildren(QDoubleSpinBox):
-                numpad_manager.install_on_widget(widget)
+            # Walk the widget tree once and dispatch on the input type
+            for widget in self.findChildren(QWidget):
+                if isinstance(widget, _TEXT_INPUT_TYPES):
+                    keyboard_manager.install_on_widget(widget)
+                elif isinstance(widget, _NUMERIC_INPUT_TYPES):
+                    numpad_manager.install_on_widget(widget)
         except Exception as e:
             self.logger.warning(f"Failed to install virtual inputs on {self.module_name}", exception=e)
 
     def _default_handle_error(self, title: str, message: str):
         """Fallback error handler used before helpers are injected."""
         self._error_count += 1
+        key = f"{title}|{message}"
+        now = time.monotonic()
+        if key == self._last_error_key and now - self._last_error_log_ts < self.ERROR_REPEAT_WINDOW:
+            self._error_repeat_count += 1
+            return
+        self._flush_repeated_errors()
         self._last_error = f"{title}: {message}"
+        self._last_error_key = key
+        self._last_error_log_ts = now
         self.logger.error(
             f"Module error in {self.module_name}: {title} - {message}"
         )
 
+    def _flush_repeated_errors(self):
+        """Log a summary for errors suppressed as repeats of the last one."""
+        if self._error_repeat_count:
+            self.logger.error(
+                f"Module error in {self.module_name}: {self._last_error} "
+                f"(repeated {self._error_repeat_count} times)"
+            )
+            self._error_repeat_count = 0
+
     def _handle_error(self, title: str, message: str):
         """Internal hook that defers to the default handler.
 
@@ -206,27 +384,110 @@ class BaseModule(QWidget, LoggableMixin):
         """
 
         self._default_handle_error(title, message)
+    def cleanup(self):
+        """Clean up resources when module is closed."""
+        self._flush_repeated_errors()
+        if self._settings is not None:
+            self._settings.flush()
+        self._initialized = False
+        self.logger.info(f"Module {self.module_name} cleaned up")
+    def cleanup_io(self):
+        """Persist module data during shutdown. Override in subclasses.
+
+        Runs on a worker thread after :meth:`cleanup`, concurrently with the
+        other modules, so implementations must not touch widgets.
+        """
+    def get_display_name(self) -> str:
+        """Return the display name for this module."""
+        return self.module_name
+    def get_description(self) -> str:
+        """Return a description of this module's functionality."""
+        return f"{self.module_name} module for Hunt Pro"
+    def is_initialized(self) -> bool:
+        """Check if module is properly initialized."""
+        return self._initialized
+    def _get_error_handler(self):
+        """Return the error handler callback for the module."""
+        handler = getattr(self, "_handle_error", None)
+        if handler is None:
+            handler = self._default_handle_error
+            # Store handler on the instance for future lookups and introspection
+            setattr(self, "_handle_error", handler)
+        return handler
+
+    def get_last_error(self) -> Optional[str]:
+        """Get the last error that occurred in this module."""
+        return self._last_error
+    def save_state(self):
+        """Save module state to settings."""
+        self.settings.setValue("initialized", self._initialized)
+        self.settings.setValue("error_count", self._error_count)
+        SettingsWriter.instance().enqueue(self.settings.backend, self.settings.take_changes())
+    def restore_state(self):
+        """Restore module state from settings."""
+        self._error_count = self.settings.value("error_count", 0, int)
 class SettingsDialog(QDialog):
     # Unified application settings interface with grouped controls.
+    # Tooltip text per tab, keyed by widget attribute; applied once each tab is built.
+    _TOOLTIPS = {
+        'general': {
+            'call_sign_edit': 'Used for log exports, device pairing, and teammate callouts.',
+            'primary_region_combo': 'Determines localized presets like sunrise calculations and measurement units.',
+            'log_retention_spin': 'Number of days to retain hunt logs before archival.',
+            'auto_backup_checkbox': 'Synchronizes critical hunt data to linked storage whenever connectivity is detected.',
+            'prompt_before_sync_checkbox': 'Avoid unexpected data usage by confirming large uploads on metered connections.',
+            'launch_on_start_checkbox': 'Adds Hunt Pro to the operating system boot sequence.',
+            'show_tips_checkbox': 'Surface quick reminders for safety checks and calibration tasks when the app opens.',
+        },
+        'display': {
+            'theme_combo': 'Switch between dark, light, or automatic theming based on ambient light sensors.',
+            'font_scale_spin': 'Adjust text scaling for improved readability in different lighting conditions.',
+            'high_contrast_checkbox': 'Enhances separation between map overlays and UI chrome for gloved operation.',
+            'distance_units_combo': 'Sets preferred distance units for range cards, GPS readouts, and ballistic charts.',
+            'temperature_units_combo': 'Controls how environmental sensors report ambient conditions.',
+        },
+    }
     def __init__(self, parent: Optional[QWidget], settings: QSettings):
         super().__init__(parent)
-        self.settings = settings
+        self.settings = CachedSettings(settings)
         self.setWindowTitle('Hunt Pro Settings')
         self.setModal(True)
         self.resize(720, 520)
-        self._suppress_profile_custom = False
+        # Widgets whose edits switch the profile selector to "Custom Setup"
+        self._profile_widgets: List[QWidget] = []
+        self._display_tab_built = False
+        self._modules_tab_built = False
+        self._combo_indexes: Dict[QComboBox, Dict[str, int]] = {}
+        self._field_widget_map: Optional[Dict[str, Optional[QWidget]]] = None
+        self._last_valid_preview: Optional[Dict[str, Any]] = None
         self._build_ui()
         self._connect_profile_watchers()
         self._handle_preset_change()
         self.load_settings()
+        # Live validation runs at most once per 250 ms while the user types
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(250)
+        self._validate_timer.timeout.connect(self._do_validate)
+        self.call_sign_edit.textChanged.connect(self._schedule_validation)
+        self.log_retention_spin.valueChanged.connect(self._schedule_validation)
     def _build_ui(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
         self.tab_widget = QTabWidget()
         self.tab_widget.addTab(self._create_general_tab(), 'General')
-        self.tab_widget.addTab(self._create_display_tab(), 'Display')
-        self.tab_widget.addTab(self._create_modules_tab(), 'Modules')
+        # Display and Modules are built the first time they are needed
+        self._deferred_tabs = {
+            self.tab_widget.addTab(QWidget(), 'Display'): self._build_display_tab,
+            self.tab_widget.addTab(QWidget(), 'Modules'): self._build_modules_tab,
+        }
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
         layout.addWidget(self.tab_widget)
+        self.validation_hint_label = QLabel()
+        self.validation_hint_label.setObjectName('validationHint')
+        self.validation_hint_label.setWordWrap(True)
+        self.validation_hint_label.hide()
+        layout.addWidget(self.validation_hint_label)
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
@@ -240,17 +501,9 @@ class SettingsDialog(QDialog):
         identity_form.setLabelAlignment(Qt.AlignRight)
         self.call_sign_edit = QLineEdit()
         self.call_sign_edit.setPlaceholderText('E.g. Falcon-01')
-        self.call_sign_edit.setToolTip('Used for log exports, device pairing, and teammate callouts.')
         identity_form.addRow('Call Sign', self.call_sign_edit)
         self.primary_region_combo = QComboBox()
-        self.primary_region_combo.addItems([
-            'North America',
-            'South America',
-            'Europe',
-            'Africa',
-            'Asia-Pacific'
-        ])
-        self.primary_region_combo.setToolTip('Determines localized presets like sunrise calculations and measurement units.')
+        self._populate_combo(self.primary_region_combo, REGION_CHOICES)
         identity_form.addRow('Primary Region', self.primary_region_combo)
         identity_group.setLayout(identity_form)
         layout.addWidget(identity_group)
@@ -261,7 +514,7 @@ class SettingsDialog(QDialog):
         self.profile_preset_combo = QComboBox()
         self.profile_preset_combo.addItem('Custom Setup', userData=None)
         for preset in PROFILE_PRESETS:
-            self.profile_preset_combo.addItem(preset['title'], userData=preset['key'])
+            self.profile_preset_combo.addItem(preset.title, userData=preset.key)
         self.profile_preset_combo.currentIndexChanged.connect(self._handle_preset_change)
         selector_layout.addWidget(self.profile_preset_combo, 1)
         self.apply_preset_button = QPushButton('Apply Preset')
@@ -280,13 +533,10 @@ class SettingsDialog(QDialog):
         self.log_retention_spin = QSpinBox()
         self.log_retention_spin.setRange(7, 365)
         self.log_retention_spin.setSuffix(' days')
-        self.log_retention_spin.setToolTip('Number of days to retain hunt logs before archival.')
         operations_form.addRow('Log Retention', self.log_retention_spin)
         self.auto_backup_checkbox = QCheckBox('Enable automatic cloud backups')
-        self.auto_backup_checkbox.setToolTip('Synchronizes critical hunt data to linked storage whenever connectivity is detected.')
         operations_form.addRow('Cloud Backup', self.auto_backup_checkbox)
         self.prompt_before_sync_checkbox = QCheckBox('Prompt before syncing over cellular data')
-        self.prompt_before_sync_checkbox.setToolTip('Avoid unexpected data usage by confirming large uploads on metered connections.')
         operations_form.addRow('Cellular Sync', self.prompt_before_sync_checkbox)
         operations_group.setLayout(operations_form)
         layout.addWidget(operations_group)
@@ -294,15 +544,73 @@ class SettingsDialog(QDialog):
         behavior_form = QFormLayout()
         behavior_form.setLabelAlignment(Qt.AlignRight)
         self.launch_on_start_checkbox = QCheckBox('Start Hunt Pro when my system boots')
-        self.launch_on_start_checkbox.setToolTip('Adds Hunt Pro to the operating system boot sequence.')
         behavior_form.addRow('Autostart', self.launch_on_start_checkbox)
         self.show_tips_checkbox = QCheckBox('Show workflow tips on launch')
-        self.show_tips_checkbox.setToolTip('Surface quick reminders for safety checks and calibration tasks when the app opens.')
         behavior_form.addRow('Helpful Tips', self.show_tips_checkbox)
         behavior_group.setLayout(behavior_form)
         layout.addWidget(behavior_group)
         layout.addStretch()
+        self._apply_tooltips('general')
+        return tab
+    def _apply_tooltips(self, tab_key: str):
+        for attr, tip in self._TOOLTIPS[tab_key].items():
+            getattr(self, attr).setToolTip(tip)
+    def _populate_combo(self, combo: QComboBox, items: tuple):
+        combo.addItems(list(items))
+        self._combo_indexes[combo] = _choice_indexes(items)
+    def _restore_combo(self, combo: QComboBox, value: Any, default: Optional[str] = None):
+        """Select ``value`` (or ``default``) using the index map built with the combo."""
+        indexes = self._combo_indexes[combo]
+        index = indexes.get(value)
+        if index is None and default is not None:
+            index = indexes.get(default)
+        if index is not None:
+            combo.setCurrentIndex(index)
+    def _ensure_tab_built(self, index: int):
+        """Replace a placeholder tab with its real contents on first use."""
+        builder = self._deferred_tabs.pop(index, None)
+        if builder is None:
+            return
+        title = self.tab_widget.tabText(index)
+        was_current = self.tab_widget.currentIndex() == index
+        tab = builder()
+        signals_blocked = self.tab_widget.blockSignals(True)
+        try:
+            placeholder = self.tab_widget.widget(index)
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab, title)
+            if was_current:
+                self.tab_widget.setCurrentIndex(index)
+            placeholder.deleteLater()
+        finally:
+            self.tab_widget.blockSignals(signals_blocked)
+    def _ensure_all_tabs_built(self):
+        for index in list(self._deferred_tabs):
+            self._ensure_tab_built(index)
+    def _build_display_tab(self) -> QWidget:
+        tab = self._create_display_tab()
+        self._display_tab_built = True
+        self._watch_profile_changes([
+            self.theme_combo,
+            self.font_scale_spin,
+            self.high_contrast_checkbox,
+            self.distance_units_combo,
+            self.temperature_units_combo,
+        ])
+        self._load_without_marking_custom(self._load_display_settings)
+        return tab
+    def _build_modules_tab(self) -> QWidget:
+        tab = self._create_modules_tab()
+        self._modules_tab_built = True
+        self._watch_profile_changes(self.module_checkboxes.values())
+        self._load_without_marking_custom(self._load_module_settings)
         return tab
+    def _load_without_marking_custom(self, loader):
+        """Run ``loader`` with the profile widgets' change signals blocked."""
+        with ExitStack() as stack:
+            for widget in self._profile_widgets:
+                stack.enter_context(QSignalBlocker(widget))
+            loader()
     def _create_display_tab(self) -> QWidget:
         tab = QWidget()
         layout = QVBoxLayout(tab)
@@ -311,17 +619,14 @@ class SettingsDialog(QDialog):
         appearance_form = QFormLayout()
         appearance_form.setLabelAlignment(Qt.AlignRight)
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems(['Dark', 'Light', 'Auto'])
-        self.theme_combo.setToolTip('Switch between dark, light, or automatic theming based on ambient light sensors.')
+        self._populate_combo(self.theme_combo, THEME_CHOICES)
         appearance_form.addRow('Theme', self.theme_combo)
         self.font_scale_spin = QSpinBox()
         self.font_scale_spin.setRange(80, 140)
         self.font_scale_spin.setSuffix(' %')
         self.font_scale_spin.setSingleStep(5)
-        self.font_scale_spin.setToolTip('Adjust text scaling for improved readability in different lighting conditions.')
         appearance_form.addRow('Font Scale', self.font_scale_spin)
         self.high_contrast_checkbox = QCheckBox('Enable high contrast overlays')
-        self.high_contrast_checkbox.setToolTip('Enhances separation between map overlays and UI chrome for gloved operation.')
         appearance_form.addRow('High Contrast', self.high_contrast_checkbox)
         appearance_group.setLayout(appearance_form)
         layout.addWidget(appearance_group)
@@ -329,16 +634,15 @@ class SettingsDialog(QDialog):
         units_form = QFormLayout()
         units_form.setLabelAlignment(Qt.AlignRight)
         self.distance_units_combo = QComboBox()
-        self.distance_units_combo.addItems(['Metric (meters)', 'Imperial (yards)'])
-        self.distance_units_combo.setToolTip('Sets preferred distance units for range cards, GPS readouts, and ballistic charts.')
+        self._populate_combo(self.distance_units_combo, DISTANCE_UNIT_CHOICES)
         units_form.addRow('Distance Units', self.distance_units_combo)
         self.temperature_units_combo = QComboBox()
-        self.temperature_units_combo.addItems(['Celsius', 'Fahrenheit'])
-        self.temperature_units_combo.setToolTip('Controls how environmental sensors report ambient conditions.')
+        self._populate_combo(self.temperature_units_combo, TEMPERATURE_UNIT_CHOICES)
         units_form.addRow('Temperature', self.temperature_units_combo)
         units_group.setLayout(units_form)
         layout.addWidget(units_group)
         layout.addStretch()
+        self._apply_tooltips('display')
         return tab
     def _create_modules_tab(self) -> QWidget:
         tab = QWidget()
@@ -351,92 +655,129 @@ class SettingsDialog(QDialog):
         layout.addWidget(overview_label)
         modules_group = QGroupBox('Startup Modules')
         modules_layout = QVBoxLayout()
-        self.module_checkboxes: Dict[str, QCheckBox] = {}
-        module_descriptions = {
-            'ballistics': 'Calculates drop charts, wind holds, and rifle profiles for your active weapon systems.',
-            'nav_map': 'Provides offline maps, GPS breadcrumbs, and waypoint management for navigation.',
-            'game_log': 'Captures harvest data, sightings, and tag compliance notes during hunts.'
-        }
-        for module_key, description in module_descriptions.items():
-            checkbox = QCheckBox(module_key.replace('_', ' ').title())
-            checkbox.setToolTip(description)
-            modules_layout.addWidget(checkbox)
-            self.module_checkboxes[module_key] = checkbox
+        checkboxes = [
+            QCheckBox(module_key.replace('_', ' ').title())
+            for module_key in STARTUP_MODULE_DESCRIPTIONS
+        ]
+        modules_group.setUpdatesEnabled(False)
+        try:
+            for checkbox, description in zip(checkboxes, STARTUP_MODULE_DESCRIPTIONS.values()):
+                checkbox.setToolTip(description)
+                modules_layout.addWidget(checkbox)
+        finally:
+            modules_group.setUpdatesEnabled(True)
+        self.module_checkboxes: Dict[str, QCheckBox] = dict(zip(STARTUP_MODULE_DESCRIPTIONS, checkboxes))
         modules_group.setLayout(modules_layout)
         layout.addWidget(modules_group)
         layout.addStretch()
         return tab
     def load_settings(self):
-        self.call_sign_edit.setText(self.settings.value('general/call_sign', ''))
-        region = self.settings.value('general/primary_region', 'North America')
-        index = self.primary_region_combo.findText(region)
-        if index >= 0:
-            self.primary_region_combo.setCurrentIndex(index)
-        self.log_retention_spin.setValue(int(self.settings.value('general/log_retention', 30)))
-        self.auto_backup_checkbox.setChecked(self.settings.value('general/auto_backup', True, bool))
-        self.prompt_before_sync_checkbox.setChecked(
-            self.settings.value('general/prompt_before_sync', True, bool)
-        )
-        self.launch_on_start_checkbox.setChecked(self.settings.value('general/launch_on_start', False, bool))
-        self.show_tips_checkbox.setChecked(self.settings.value('general/show_tips', True, bool))
-        theme = self.settings.value('display/theme', 'Dark')
-        index = self.theme_combo.findText(theme)
-        if index >= 0:
-            self.theme_combo.setCurrentIndex(index)
-        self.font_scale_spin.setValue(int(self.settings.value('display/font_scale', 100)))
-        self.high_contrast_checkbox.setChecked(self.settings.value('display/high_contrast', False, bool))
-        distance_units = self.settings.value('display/distance_units', 'Metric (meters)')
-        index = self.distance_units_combo.findText(distance_units)
-        if index >= 0:
-            self.distance_units_combo.setCurrentIndex(index)
-        temperature_units = self.settings.value('display/temperature_units', 'Celsius')
-        index = self.temperature_units_combo.findText(temperature_units)
-        if index >= 0:
-            self.temperature_units_combo.setCurrentIndex(index)
-        for module_key, checkbox in self.module_checkboxes.items():
-            checkbox.setChecked(self.settings.value(f'modules/{module_key}', True, bool))
+        # One pass per section; the loaders below are then served from memory
+        for section in ('general', 'display', 'modules'):
+            self.settings.preload(section)
+        self._load_without_marking_custom(self._load_general_settings)
+        if self._display_tab_built:
+            self._load_without_marking_custom(self._load_display_settings)
+        if self._modules_tab_built:
+            self._load_without_marking_custom(self._load_module_settings)
 
         stored_preset = self.settings.value('general/active_preset', '', str)
         self._update_profile_selector(stored_preset or None)
-    def save_settings(self):
-        self.settings.setValue('general/call_sign', self.call_sign_edit.text().strip())
-        self.settings.setValue('general/primary_region', self.primary_region_combo.currentText())
-        self.settings.setValue('general/log_retention', self.log_retention_spin.value())
-        self.settings.setValue('general/auto_backup', self.auto_backup_checkbox.isChecked())
-        self.settings.setValue('general/prompt_before_sync', self.prompt_before_sync_checkbox.isChecked())
-        self.settings.setValue('general/launch_on_start', self.launch_on_start_checkbox.isChecked())
-        self.settings.setValue('general/show_tips', self.show_tips_checkbox.isChecked())
-        self.settings.setValue('display/theme', self.theme_combo.currentText())
-        self.settings.setValue('display/font_scale', self.font_scale_spin.value())
-        self.settings.setValue('display/high_contrast', self.high_contrast_checkbox.isChecked())
-        self.settings.setValue('display/distance_units', self.distance_units_combo.currentText())
-        self.settings.setValue('display/temperature_units', self.temperature_units_combo.currentText())
-        for module_key, checkbox in self.module_checkboxes.items():
-            self.settings.setValue(f'modules/{module_key}', checkbox.isChecked())
-
-        current_settings = self._collect_settings_preview()
-        matching_preset = None
-        for preset in PROFILE_PRESETS:
-            if self._settings_match_preset(current_settings, preset):
-                matching_preset = preset['key']
-                break
-        self.settings.setValue('general/active_preset', matching_preset or '')
+    def _load_general_settings(self):
+        self.settings.beginGroup('general')
+        try:
+            self.call_sign_edit.setText(self.settings.value('call_sign', ''))
+            self._restore_combo(
+                self.primary_region_combo,
+                self.settings.value('primary_region', 'North America'),
+                'North America',
+            )
+            self.log_retention_spin.setValue(self.settings.value('log_retention', 30, int))
+            self.auto_backup_checkbox.setChecked(self.settings.value('auto_backup', True, bool))
+            self.prompt_before_sync_checkbox.setChecked(
+                self.settings.value('prompt_before_sync', True, bool)
+            )
+            self.launch_on_start_checkbox.setChecked(self.settings.value('launch_on_start', False, bool))
+            self.show_tips_checkbox.setChecked(self.settings.value('show_tips', True, bool))
+        finally:
+            self.settings.endGroup()
+    def _load_display_settings(self):
+        self.settings.beginGroup('display')
+        try:
+            self._restore_combo(self.theme_combo, self.settings.value('theme', 'Dark'), 'Dark')
+            self.font_scale_spin.setValue(self.settings.value('font_scale', 100, int))
+            self.high_contrast_checkbox.setChecked(self.settings.value('high_contrast', False, bool))
+            self._restore_combo(
+                self.distance_units_combo,
+                self.settings.value('distance_units', 'Metric (meters)'),
+                'Metric (meters)',
+            )
+            self._restore_combo(
+                self.temperature_units_combo,
+                self.settings.value('temperature_units', 'Celsius'),
+                'Celsius',
+            )
+        finally:
+            self.settings.endGroup()
+    def _load_module_settings(self):
+        self.settings.beginGroup('modules')
+        try:
+            for module_key, checkbox in self.module_checkboxes.items():
+                checkbox.setChecked(self.settings.value(module_key, True, bool))
+        finally:
+            self.settings.endGroup()
+    def save_settings(self, current_settings: Optional[Dict[str, Any]] = None):
+        if current_settings is None:
+            current_settings = self._collect_settings_preview()
+        matching_preset = match_profile_preset(current_settings)
+        sections = {
+            'general': {
+                'call_sign': current_settings['call_sign'],
+                'primary_region': current_settings['primary_region'],
+                'log_retention': current_settings['log_retention'],
+                'auto_backup': current_settings['auto_backup'],
+                'prompt_before_sync': current_settings['prompt_before_sync'],
+                'launch_on_start': current_settings['launch_on_start'],
+                'show_tips': current_settings['show_tips'],
+                'active_preset': matching_preset or '',
+            },
+            'display': {
+                'theme': current_settings['theme'],
+                'font_scale': current_settings['font_scale'],
+                'high_contrast': current_settings['high_contrast'],
+                'distance_units': current_settings['distance_units'],
+                'temperature_units': current_settings['temperature_units'],
+            },
+            'modules': current_settings['modules'],
+        }
+        for group, values in sections.items():
+            self.settings.beginGroup(group)
+            try:
+                for key, value in values.items():
+                    self.settings.setValue(key, value)
+            finally:
+                self.settings.endGroup()
+        # The writer applies the whole batch and syncs the store once
+        SettingsWriter.instance().enqueue(self.settings.backend, self.settings.take_changes())
     def _collect_settings_preview(self) -> Dict[str, Any]:
         """Gather the current dialog state into a mapping for validation."""
 
+        self._ensure_all_tabs_built()
+        # Fixed-choice combos map their index back to the interned choice
+        # rather than converting the item text from Qt.
         return {
             'call_sign': self.call_sign_edit.text().strip(),
-            'primary_region': self.primary_region_combo.currentText(),
+            'primary_region': REGION_CHOICES[self.primary_region_combo.currentIndex()],
             'log_retention': self.log_retention_spin.value(),
             'auto_backup': self.auto_backup_checkbox.isChecked(),
             'prompt_before_sync': self.prompt_before_sync_checkbox.isChecked(),
             'launch_on_start': self.launch_on_start_checkbox.isChecked(),
             'show_tips': self.show_tips_checkbox.isChecked(),
-            'theme': self.theme_combo.currentText(),
+            'theme': THEME_CHOICES[self.theme_combo.currentIndex()],
             'font_scale': self.font_scale_spin.value(),
             'high_contrast': self.high_contrast_checkbox.isChecked(),
-            'distance_units': self.distance_units_combo.currentText(),
-            'temperature_units': self.temperature_units_combo.currentText(),
+            'distance_units': DISTANCE_UNIT_CHOICES[self.distance_units_combo.currentIndex()],
+            'temperature_units': TEMPERATURE_UNIT_CHOICES[self.temperature_units_combo.currentIndex()],
             'modules': {
                 module_key: checkbox.isChecked()
                 for module_key, checkbox in self.module_checkboxes.items()
@@ -447,17 +788,20 @@ class SettingsDialog(QDialog):
     def _widget_for_field(self, field: str) -> Optional[QWidget]:
         """Return the widget associated with the provided validation field."""
 
-        mapping = {
-            'call_sign': self.call_sign_edit,
-            'log_retention': self.log_retention_spin,
-            'font_scale': self.font_scale_spin,
-            'auto_backup': self.auto_backup_checkbox,
-            'prompt_before_sync': self.prompt_before_sync_checkbox,
-            'modules': next(iter(self.module_checkboxes.values()), None),
-        }
-        return mapping.get(field)
+        if self._field_widget_map is None:
+            # Built on first use because some widgets live on deferred tabs
+            self._ensure_all_tabs_built()
+            self._field_widget_map = {
+                'call_sign': self.call_sign_edit,
+                'log_retention': self.log_retention_spin,
+                'font_scale': self.font_scale_spin,
+                'auto_backup': self.auto_backup_checkbox,
+                'prompt_before_sync': self.prompt_before_sync_checkbox,
+                'modules': next(iter(self.module_checkboxes.values()), None),
+            }
+        return self._field_widget_map.get(field)
 
-    def _show_validation_issue(self, issue: ValidationIssue):
+    def _show_validation_issue(self, issue: 'ValidationIssue'):
         """Display a contextual validation warning and focus the related widget."""
 
         QMessageBox.warning(self, issue.title, issue.message)
@@ -482,7 +826,7 @@ class SettingsDialog(QDialog):
                 'Fine-tune each field to craft a custom operator profile for this device.'
             )
         else:
-            self.preset_description_label.setText(preset['description'])
+            self.preset_description_label.setText(preset.description)
 
     def _apply_selected_preset(self):
         key = self.profile_preset_combo.currentData()
@@ -494,94 +838,63 @@ class SettingsDialog(QDialog):
         preset = PROFILE_PRESET_MAP.get(preset_key)
         if not preset:
             return
-        self._suppress_profile_custom = True
-        try:
-            general = preset.get('general', {})
-            if 'primary_region' in general:
-                index = self.primary_region_combo.findText(general['primary_region'])
-                if index >= 0:
-                    self.primary_region_combo.setCurrentIndex(index)
-            if 'log_retention' in general:
-                self.log_retention_spin.setValue(int(general['log_retention']))
-            if 'auto_backup' in general:
-                self.auto_backup_checkbox.setChecked(bool(general['auto_backup']))
-            if 'prompt_before_sync' in general:
-                self.prompt_before_sync_checkbox.setChecked(bool(general['prompt_before_sync']))
-            if 'launch_on_start' in general:
-                self.launch_on_start_checkbox.setChecked(bool(general['launch_on_start']))
-            if 'show_tips' in general:
-                self.show_tips_checkbox.setChecked(bool(general['show_tips']))
+        self._ensure_all_tabs_built()
+        self._load_without_marking_custom(lambda: self._set_preset_values(preset))
+        self._update_profile_selector(preset_key)
 
-            display = preset.get('display', {})
-            if 'theme' in display:
-                index = self.theme_combo.findText(display['theme'])
-                if index >= 0:
-                    self.theme_combo.setCurrentIndex(index)
-            if 'font_scale' in display:
-                self.font_scale_spin.setValue(int(display['font_scale']))
-            if 'high_contrast' in display:
-                self.high_contrast_checkbox.setChecked(bool(display['high_contrast']))
-            if 'distance_units' in display:
-                index = self.distance_units_combo.findText(display['distance_units'])
-                if index >= 0:
-                    self.distance_units_combo.setCurrentIndex(index)
-            if 'temperature_units' in display:
-                index = self.temperature_units_combo.findText(display['temperature_units'])
-                if index >= 0:
-                    self.temperature_units_combo.setCurrentIndex(index)
+    def _set_preset_values(self, preset: ProfilePreset):
+        general = preset.general
+        self._restore_combo(self.primary_region_combo, general.primary_region)
+        self.log_retention_spin.setValue(general.log_retention)
+        self.auto_backup_checkbox.setChecked(general.auto_backup)
+        self.prompt_before_sync_checkbox.setChecked(general.prompt_before_sync)
+        self.launch_on_start_checkbox.setChecked(general.launch_on_start)
+        self.show_tips_checkbox.setChecked(general.show_tips)
 
-            modules = preset.get('modules', {})
-            for module_key, checkbox in self.module_checkboxes.items():
-                if module_key in modules:
-                    checkbox.setChecked(bool(modules[module_key]))
-        finally:
-            self._suppress_profile_custom = False
-        self._update_profile_selector(preset_key)
+        display = preset.display
+        self._restore_combo(self.theme_combo, display.theme)
+        self.font_scale_spin.setValue(display.font_scale)
+        self.high_contrast_checkbox.setChecked(display.high_contrast)
+        self._restore_combo(self.distance_units_combo, display.distance_units)
+        self._restore_combo(self.temperature_units_combo, display.temperature_units)
+
+        for module_key, checkbox in self.module_checkboxes.items():
+            enabled = getattr(preset.modules, module_key, None)
+            if enabled is not None:
+                checkbox.setChecked(enabled)
 
     def _mark_custom_profile(self):
-        if self._suppress_profile_custom:
-            return
         custom_index = self.profile_preset_combo.findData(None)
         if custom_index >= 0 and self.profile_preset_combo.currentIndex() != custom_index:
             self.profile_preset_combo.setCurrentIndex(custom_index)
 
     def _connect_profile_watchers(self):
-        watchers = [
-            self.primary_region_combo.currentIndexChanged,
-            self.log_retention_spin.valueChanged,
-            self.auto_backup_checkbox.toggled,
-            self.prompt_before_sync_checkbox.toggled,
-            self.launch_on_start_checkbox.toggled,
-            self.show_tips_checkbox.toggled,
-            self.theme_combo.currentIndexChanged,
-            self.font_scale_spin.valueChanged,
-            self.high_contrast_checkbox.toggled,
-            self.distance_units_combo.currentIndexChanged,
-            self.temperature_units_combo.currentIndexChanged,
-        ]
-        for signal in watchers:
-            signal.connect(self._mark_custom_profile)
-        for checkbox in self.module_checkboxes.values():
-            checkbox.toggled.connect(self._mark_custom_profile)
+        # Deferred tabs register their own watchers when they are built
+        self._watch_profile_changes([
+            self.primary_region_combo,
+            self.log_retention_spin,
+            self.auto_backup_checkbox,
+            self.prompt_before_sync_checkbox,
+            self.launch_on_start_checkbox,
+            self.show_tips_checkbox,
+        ])
 
-    def _settings_match_preset(self, current_settings: Dict[str, Any], preset: Dict[str, Any]) -> bool:
-        preset_general = preset.get('general', {})
-        for key, value in preset_general.items():
-            if current_settings.get(key) != value:
-                return False
-        preset_display = preset.get('display', {})
-        for key, value in preset_display.items():
-            if current_settings.get(key) != value:
-                return False
-        preset_modules = preset.get('modules', {})
-        current_modules = current_settings.get('modules', {})
-        for key, value in preset_modules.items():
-            if current_modules.get(key) != bool(value):
-                return False
-        return True
+    def _watch_profile_changes(self, widgets: Iterable[QWidget]):
+        for widget in widgets:
+            if isinstance(widget, QComboBox):
+                widget.currentIndexChanged.connect(self._mark_custom_profile)
+            elif isinstance(widget, QSpinBox):
+                widget.valueChanged.connect(self._mark_custom_profile)
+            else:
+                widget.toggled.connect(self._mark_custom_profile)
+            self._profile_widgets.append(widget)
 
-    def validate_inputs(self) -> bool:
-        preview = self._collect_settings_preview()
+    def validate_inputs(self, preview: Optional[Dict[str, Any]] = None) -> bool:
+        if preview is None:
+            preview = self._collect_settings_preview()
+        if preview == self._last_valid_preview:
+            return True
+        from config_validation import validate_configuration
         issues = validate_configuration(
             preview,
             available_modules=self.module_checkboxes.keys(),
@@ -589,53 +902,58 @@ class SettingsDialog(QDialog):
         if issues:
             self._show_validation_issue(issues[0])
             return False
+        self._last_valid_preview = preview
         return True
+    def _schedule_validation(self, *_args):
+        self._validate_timer.start()
+    def _do_validate(self):
+        """Show the first problem with the live-validated fields inline."""
+        # Only the fields edited on the General tab are checked here so live
+        # feedback never forces the deferred tabs to be built.
+        preview = {
+            'call_sign': self.call_sign_edit.text().strip(),
+            'log_retention': self.log_retention_spin.value(),
+        }
+        from config_validation import validate_configuration
+        issues = [
+            issue
+            for issue in validate_configuration(preview, available_modules=())
+            if issue.field in preview
+        ]
+        if issues:
+            self.validation_hint_label.setText(f"{issues[0].title}: {issues[0].message}")
+        self.validation_hint_label.setVisible(bool(issues))
     def accept(self):
-        if not self.validate_inputs():
+        self._validate_timer.stop()
+        # One snapshot of the widgets serves both validation and saving
+        preview = self._collect_settings_preview()
+        if not self.validate_inputs(preview):
             return
-        self.save_settings()
+        self.save_settings(preview)
         super().accept()
-    def cleanup(self):
-        """Clean up resources when module is closed."""
-        self._initialized = False
-        self.logger.info(f"Module {self.module_name} cleaned up")
-    def get_display_name(self) -> str:
-        """Return the display name for this module."""
-        return self.module_name
-    def get_description(self) -> str:
-        """Return a description of this module's functionality."""
-        return f"{self.module_name} module for Hunt Pro"
-    def is_initialized(self) -> bool:
-        """Check if module is properly initialized."""
-        return self._initialized
-    def _get_error_handler(self):
-        """Return the error handler callback for the module."""
-        handler = getattr(self, "_handle_error", None)
-        if handler is None:
-            handler = self._default_handle_error
-            # Store handler on the instance for future lookups and introspection
-            setattr(self, "_handle_error", handler)
-        return handler
-
-    def _default_handle_error(self, title: str, message: str):
-        """Default internal error handler to track error statistics."""
-        self._error_count += 1
-        self._last_error = f"{title}: {message}"
-        self.logger.error(f"Module error in {self.module_name}: {title} - {message}")
+class _ModuleImportTask(QRunnable):
+    """Thread pool task that imports a feature module ahead of instantiation.
 
-    def _handle_error(self, title: str, message: str):
-        """Internal error handler to track error statistics."""
-        self._default_handle_error(title, message)
-    def get_last_error(self) -> Optional[str]:
-        """Get the last error that occurred in this module."""
-        return self._last_error
-    def save_state(self):
-        """Save module state to settings."""
-        self.settings.setValue("initialized", self._initialized)
-        self.settings.setValue("error_count", self._error_count)
-    def restore_state(self):
-        """Restore module state from settings."""
-        self._error_count = self.settings.value("error_count", 0, int)
+    With ``notify`` set the manager is told when the import has finished; the
+    signal is queued to the GUI thread, where the widget is then created.
+    """
+    def __init__(self, manager: 'ModuleManager', module_name: str, notify: bool = False):
+        super().__init__()
+        self._manager = manager
+        self._module_name = module_name
+        self._notify = notify
+    def run(self):
+        try:
+            self._manager._import_module_class(self._module_name)
+        except Exception:
+            # load_module repeats the import on the GUI thread and reports errors
+            pass
+        if self._notify:
+            try:
+                self._manager._module_imported.emit(self._module_name)
+            except RuntimeError:
+                # The manager was destroyed while the import was running
+                pass
 class ModuleManager(QObject):
     """Enhanced module manager with better error handling and loading."""
     # Signals
@@ -643,88 +961,52 @@ class ModuleManager(QObject):
     module_failed = Signal(str, str)     # module_name, error_message
     all_modules_loaded = Signal()
     loading_progress = Signal(int, str)  # progress, status
+    _module_imported = Signal(str)       # emitted from pool threads
+    PROGRESS_INTERVAL_MS = 33
+    available_modules = _AVAILABLE_MODULE_MAP
     def __init__(self, parent=None):
         super().__init__(parent)
         self.modules: Dict[str, BaseModule] = {}
         self.failed_modules: Dict[str, str] = {}
         self.logger = get_logger()
-        # Available modules with metadata
-        self.available_modules = {
-            'sensor_diagnostics': {
-                'path': 'sensor_diagnostics_module.SensorDiagnosticsModule',
-                'display_name': 'Sensors',
-                'description': 'Real-time diagnostics and calibration workflows for paired devices',
-                'icon': 'SENS',
-                'priority': 0
-            },
-            'ballistics': {
-                'path': 'ballistics.BallisticsModule',
-                'display_name': 'Ballistics',
-                'description': 'Advanced ballistics calculator with environmental corrections',
-                'icon': 'BALL',
-                'priority': 1
-            },
-            'nav_map': {
-                'path': 'nav_map.NavigationModule', 
-                'display_name': 'Navigation',
-                'description': 'GPS navigation and mapping tools',
-                'icon': 'NAV',
-                'priority': 2
-            },
-            'game_log': {
-                'path': 'game_log.GameLogModule',
-                'display_name': 'Game Log',
-                'description': 'Track hunting activities and harvests',
-                'icon': 'LOG',
-                'priority': 3
-            },
-            'field_tools': {
-                'path': 'field_tools.FieldToolsModule',
-                'display_name': 'Field Tools',
-                'description': 'Environmental calculations and first aid',
-                'icon': 'FIELD',
-                'priority': 4
-            },
-            'advanced_tools': {
-                'path': 'advanced_tools.AdvancedToolsModule',
-                'display_name': 'Advanced Tools',
-                'description': 'RF blocking, night vision, and thermal imaging',
-                'icon': 'ADV',
-                'priority': 5
-            }
-        }
-        # Ensure current directory is in Python path
-        current_dir = Path(__file__).parent
-        if str(current_dir) not in sys.path:
-            sys.path.insert(0, str(current_dir))
+        self._class_cache: Dict[str, type] = {}
+        # Progress is sampled at most every PROGRESS_INTERVAL_MS; the timer
+        # delivers the latest value that arrived inside the window.
+        self._latest_progress = (0, "")
+        self._emitted_progress: Optional[tuple] = None
+        self._last_progress_emit = 0.0
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(self.PROGRESS_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        # State of the current load_all_modules_async run
+        self._async_parent: Optional[QWidget] = None
+        self._async_queue: List[str] = []
+        self._async_imported: Set[str] = set()
+        self._async_total = 0
+        self._module_imported.connect(self._on_module_imported)
     def load_module(self, module_name: str, parent: QWidget) -> Optional[BaseModule]:
         """Load a module by name with enhanced error handling."""
+        # Interned names let the manager's dict lookups short-circuit on identity.
+        module_name = sys.intern(module_name)
         if module_name not in self.available_modules:
             error_msg = f"Module '{module_name}' not found in available modules"
             self.module_failed.emit(module_name, error_msg)
             return None
-        module_info = self.available_modules[module_name]
         try:
-            self.logger.info(f"Loading module: {module_name}")
-            # Parse module path
-            module_path, class_name = module_info['path'].rsplit('.', 1)
-            # Import module
-            module = importlib.import_module(module_path)
-            module_class = getattr(module, class_name)
+            self.logger.info("Loading module: %s", args=(module_name,))
+            module_class = self._import_module_class(module_name)
             # Create instance
             instance = module_class(parent)
+            instance.setProperty("hp_module_name", module_name)
             # Initialize module
             if instance.initialize():
                 self.modules[module_name] = instance
                 self.module_loaded.emit(module_name, instance)
-                # Connect module signals
-                instance.status_message.connect(
-                    lambda msg, name=module_name: self._relay_status_message(name, msg)
-                )
-                instance.error_occurred.connect(
-                    lambda title, msg, name=module_name: self._relay_error(name, title, msg)
-                )
-                self.logger.info(f"Successfully loaded module: {module_name}")
+                # Connect module signals; relays read the name from the sender
+                instance.status_message.connect(self._relay_status_message)
+                instance.error_occurred.connect(self._relay_error)
+                self.logger.info("Successfully loaded module: %s", args=(module_name,))
                 return instance
             else:
                 error_msg = f"Module '{module_name}' failed to initialize"
@@ -735,50 +1017,150 @@ class ModuleManager(QObject):
             error_msg = f"Failed to import module '{module_name}': {str(e)}"
             self.failed_modules[module_name] = error_msg
             self.module_failed.emit(module_name, error_msg)
-            self.logger.error(f"Import error for module {module_name}", exception=e)
+            self.logger.error("Import error for module %s", exception=e, args=(module_name,))
             return None
         except Exception as e:
             error_msg = f"Error loading module '{module_name}': {str(e)}"
             self.failed_modules[module_name] = error_msg
             self.module_failed.emit(module_name, error_msg)
-            self.logger.error(f"Unexpected error loading module {module_name}", exception=e)
+            self.logger.error("Unexpected error loading module %s", exception=e, args=(module_name,))
             return None
-    def load_all_modules(self, parent: QWidget) -> Dict[str, BaseModule]:
-        """Load all available modules with progress tracking."""
-        # Sort modules by priority
-        sorted_modules = sorted(
-            self.available_modules.items(),
-            key=lambda x: x[1]['priority']
-        )
-        total_modules = len(sorted_modules)
-        for i, (module_name, _) in enumerate(sorted_modules):
-            progress = int((i / total_modules) * 100)
-            self.loading_progress.emit(progress, f"Loading {module_name}...")
-            self.load_module(module_name, parent)
-        self.loading_progress.emit(100, "All modules loaded")
+    def _import_module_class(self, module_name: str) -> type:
+        """Import and return the widget class for ``module_name``.
+
+        Only touches the import system, so it is safe to call off the GUI thread.
+        Resolved classes are cached so reloading a module skips the import walk.
+        """
+        module_class = self._class_cache.get(module_name)
+        if module_class is None:
+            module_path, class_name = self.available_modules[module_name]['path'].rsplit('.', 1)
+            module = importlib.import_module(module_path)
+            module_class = getattr(module, class_name)
+            self._class_cache[module_name] = module_class
+        return module_class
+    def prefetch_in_background(self, module_names: Iterable[str]):
+        """Start importing ``module_names`` on the global pool without waiting.
+
+        Modules that are loaded later, such as lazily opened tabs, then find
+        their class already imported and only pay for widget construction.
+        """
+        pool = QThreadPool.globalInstance()
+        for module_name in module_names:
+            if module_name not in self._class_cache:
+                pool.start(_ModuleImportTask(self, module_name))
+    def load_all_modules_async(self, parent: QWidget, module_names: Optional[Iterable[str]] = None):
+        """Load all available modules, or only ``module_names``, without blocking.
+
+        Imports run on the global thread pool. Each widget is created on the
+        GUI thread once its import and those of higher-priority modules have
+        finished, so modules still load in priority order. Progress is
+        reported as they load and ``all_modules_loaded`` fires at the end.
+        """
+        if module_names is None:
+            selected = list(self.available_modules)
+        else:
+            requested = set(module_names)
+            selected = [name for name in self.available_modules if name in requested]
+        self._async_parent = parent
+        self._async_queue = selected
+        self._async_imported = set()
+        self._async_total = len(selected)
+        if not selected:
+            self._finish_loading()
+            return
+        pool = QThreadPool.globalInstance()
+        for module_name in selected:
+            pool.start(_ModuleImportTask(self, module_name, notify=True))
+    @Slot(str)
+    def _on_module_imported(self, module_name: str):
+        """Create the widgets whose imports are done, in priority order."""
+        if module_name not in self._async_queue:
+            return
+        self._async_imported.add(module_name)
+        while self._async_queue and self._async_queue[0] in self._async_imported:
+            name = self._async_queue.pop(0)
+            done = self._async_total - len(self._async_queue) - 1
+            self._report_progress(int((done / self._async_total) * 100), f"Loading {name}...")
+            # The user may already have opened the module's tab
+            if name not in self.modules:
+                self.load_module(name, self._async_parent)
+        if not self._async_queue:
+            self._async_parent = None
+            self._finish_loading()
+    def _finish_loading(self):
+        self._report_progress(100, "All modules loaded")
+        self._flush_progress()
         self.all_modules_loaded.emit()
-        return self.modules.copy()
+    def _report_progress(self, progress: int, status: str):
+        """Record loader progress, emitting at most once per interval."""
+        self._latest_progress = (progress, status)
+        elapsed_ms = (time.monotonic() - self._last_progress_emit) * 1000
+        if elapsed_ms >= self.PROGRESS_INTERVAL_MS:
+            self._flush_progress()
+        elif not self._progress_timer.isActive():
+            self._progress_timer.start()
+    def _flush_progress(self):
+        """Emit the latest progress sample if it differs from the last emission."""
+        self._progress_timer.stop()
+        if self._latest_progress == self._emitted_progress:
+            return
+        self._emitted_progress = self._latest_progress
+        self._last_progress_emit = time.monotonic()
+        self.loading_progress.emit(*self._latest_progress)
     def get_module(self, module_name: str) -> Optional[BaseModule]:
         """Get a loaded module by name."""
         return self.modules.get(module_name)
     def get_module_info(self, module_name: str) -> Optional[Dict]:
         """Get module metadata."""
         return self.available_modules.get(module_name)
+    def get_display(self, module_name: str) -> Optional[tuple]:
+        """Return ``(display_name, icon)`` for a module, or ``None`` if unknown."""
+        return _MODULE_DISPLAY.get(module_name)
+    def get_label(self, module_name: str) -> Optional[str]:
+        """Return the preformatted tab title for a module."""
+        return _MODULE_LABELS.get(module_name)
     def get_failed_modules(self) -> Dict[str, str]:
         """Get list of modules that failed to load."""
         return self.failed_modules.copy()
-    def _relay_status_message(self, module_name: str, message: str):
+    def _sender_module_name(self) -> str:
+        """Return the name of the module that emitted the current signal."""
+        sender = self.sender()
+        return sender.property("hp_module_name") if sender is not None else "unknown"
+    def _relay_status_message(self, message: str):
         """Relay status messages from modules."""
-        self.logger.info(f"[{module_name}] {message}")
-    def _relay_error(self, module_name: str, title: str, message: str):
+        if self.logger.is_enabled_for(LogLevel.INFO):
+            self.logger.info(f"[{self._sender_module_name()}] {message}")
+    def _relay_error(self, title: str, message: str):
         """Relay error messages from modules."""
-        self.logger.error(f"[{module_name}] {title}: {message}")
+        if self.logger.is_enabled_for(LogLevel.ERROR):
+            self.logger.error(f"[{self._sender_module_name()}] {title}: {message}")
 class LoadingScreen(QSplashScreen):
     """Custom loading screen for Hunt Pro."""
+    # Key of the rendered splash artwork in Qt's global pixmap cache.
+    PIXMAP_CACHE_KEY = "hp:splash"
     def __init__(self):
         super().__init__()
         self.setFixedSize(600, 400)
-        # Create custom pixmap
+        self.setPixmap(self._splash_pixmap())
+        self.setWindowFlag(Qt.WindowStaysOnTopHint)
+    @classmethod
+    def _splash_pixmap(cls) -> QPixmap:
+        """Return the splash artwork, reusing the on-disk copy when present."""
+        pixmap = QPixmap()
+        if QPixmapCache.find(cls.PIXMAP_CACHE_KEY, pixmap):
+            return pixmap
+        if not pixmap.load(str(SPLASH_CACHE_PATH)) or pixmap.size() != QSize(600, 400):
+            pixmap = cls._render_pixmap()
+            try:
+                SPLASH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                pixmap.save(str(SPLASH_CACHE_PATH), "PNG")
+            except OSError as e:
+                get_logger().debug(f"Unable to cache splash screen: {e}")
+        QPixmapCache.insert(cls.PIXMAP_CACHE_KEY, pixmap)
+        return pixmap
+    @staticmethod
+    def _render_pixmap() -> QPixmap:
+        """Paint the splash artwork."""
         pixmap = QPixmap(600, 400)
         pixmap.fill(QColor("#1a2332"))
         painter = QPainter(pixmap)
@@ -793,18 +1175,81 @@ class LoadingScreen(QSplashScreen):
         painter.setFont(QFont("Arial", 24, QFont.Bold))
         painter.drawText(pixmap.rect(), Qt.AlignCenter, "Hunt Pro\nProfessional Hunting Assistant")
         painter.end()
-        self.setPixmap(pixmap)
-        self.setWindowFlag(Qt.WindowStaysOnTopHint)
+        return pixmap
+_QSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_QSS_WHITESPACE = re.compile(r"\s+")
+_QSS_PUNCTUATION_SPACE = re.compile(r"\s*([{};])\s*")
+def minify_stylesheet(style: str) -> str:
+    """Strip comments and redundant whitespace from a Qt stylesheet."""
+    style = _QSS_COMMENT.sub("", style)
+    style = _QSS_WHITESPACE.sub(" ", style)
+    # Whitespace is only dropped next to braces and semicolons; elsewhere it
+    # may be a descendant combinator.
+    return _QSS_PUNCTUATION_SPACE.sub(r"\1", style).strip()
+@lru_cache(maxsize=None)
+def load_theme_stylesheet() -> str:
+    """Read and minify the theme stylesheet once per process."""
+    return minify_stylesheet(THEME_STYLESHEET_PATH.read_text(encoding="utf-8"))
+def apply_theme(app: QApplication):
+    """Apply the modern dark theme at application scope.
+
+    Installing the stylesheet before the main window is built lets every widget
+    resolve the theme on its first polish instead of repolishing the window as
+    each module tab is added.
+    """
+    try:
+        style = load_theme_stylesheet()
+    except OSError as exc:
+        get_logger().warning(f"Unable to load theme stylesheet from {THEME_STYLESHEET_PATH}", exception=exc)
+        return
+    # Re-applying an identical stylesheet still forces Qt to repolish every widget
+    if app.styleSheet() != style:
+        app.setStyleSheet(style)
 class MainWindow(QMainWindow):
     """Modern main application window with enhanced features."""
+    _ABOUT_HTML = """
+        <h2>Hunt Pro</h2>
+        <p><b>Professional Hunting Assistant</b></p>
+        <p>Version 2.0.0 - Touch-Optimized Field Edition</p>
+        <p>Hunt Pro is a comprehensive hunting companion application featuring:</p>
+        <ul>
+        <li>Advanced ballistics calculations</li>
+        <li>GPS navigation and mapping</li>
+        <li>Game logging and tracking</li>
+        <li>Environmental field tools</li>
+        <li>Advanced tactical equipment</li>
+        </ul>
+        <p>Designed for professional hunters and outdoor enthusiasts.</p>
+        """
+    # Seconds to wait for modules to finish saving their data on close
+    CLEANUP_TIMEOUT = 3.0
+    _TRAY_NOTICE = (
+        "Hunt Pro will continue running in the system tray. "
+        "Right-click the tray icon to quit."
+    )
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Hunt Pro - Professional Hunting Assistant")
         self.setMinimumSize(1200, 800)
         # Application state
-        self.settings = QSettings("HuntPro", "HuntPro")
+        self.settings = get_settings()
         self.logger = get_logger()
+        # Placeholder tabs for modules that have not been loaded yet
+        self._module_placeholders: Dict[str, QWidget] = {}
+        self.tray_icon: Optional[QSystemTrayIcon] = None
+        # Set whenever the window is moved, resized, or changes state
+        self._geom_dirty = False
+        # saveGeometry()/saveState() bytes as restored and shown, or as last saved
+        self._saved_window_state: Optional[tuple] = None
+        # Progress messages are painted at most every 50 ms
+        self._pending_progress: Optional[str] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._flush_progress)
         # Initialize virtual input managers
+        from keyboard import VirtualKeyboardManager
+        from numpad import VirtualNumpadManager
         self.keyboard_manager = VirtualKeyboardManager()
         self.numpad_manager = VirtualNumpadManager()
         # Initialize module manager
@@ -815,7 +1260,6 @@ class MainWindow(QMainWindow):
         self.module_manager.loading_progress.connect(self._on_loading_progress)
         # Setup UI
         self.setup_ui()
-        self.apply_theme()
         self.restore_window_state()
         # Load modules after UI is ready
         QTimer.singleShot(100, self._load_modules)
@@ -841,6 +1285,12 @@ class MainWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Starting Hunt Pro...")
+        # Module loading progress; the bar repaints far less than the message
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.setTextVisible(False)
+        self.status_bar.addPermanentWidget(self.progress_bar)
     def create_header(self, layout):
         """Create application header with title and controls."""
         header = QFrame()
@@ -866,118 +1316,125 @@ class MainWindow(QMainWindow):
         layout.addWidget(header)
     def setup_system_tray(self):
         """Setup system tray icon and menu."""
-        if QSystemTrayIcon.isSystemTrayAvailable():
-            self.tray_icon = QSystemTrayIcon(self)
-            self.tray_icon.setToolTip("Hunt Pro - Professional Hunting Assistant")
-            # Create tray menu
-            tray_menu = QMenu()
-            show_action = QAction("Show Hunt Pro", self)
-            show_action.triggered.connect(self.show)
-            tray_menu.addAction(show_action)
-            tray_menu.addSeparator()
-            quit_action = QAction("Quit", self)
-            quit_action.triggered.connect(QApplication.quit)
-            tray_menu.addAction(quit_action)
-            self.tray_icon.setContextMenu(tray_menu)
-            self.tray_icon.show()
-    def apply_theme(self):
-        """Apply modern dark theme to the application."""
-        style = """
-        /* Main Window */
-        QMainWindow {
-            background-color: #1a2332;
-            color: white;
-        }
-        /* Header */
-        QFrame#header {
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                stop:0 #2c5aa0, stop:1 #1a2332);
-            border-bottom: 2px solid #3d5a8c;
-        }
-        QLabel#title {
-            color: white;
-            font-size: 20px;
-            font-weight: bold;
-        }
-        QPushButton#header_button {
-            background-color: rgba(255, 255, 255, 0.1);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            border-radius: 8px;
-            padding: 8px 16px;
-            color: white;
-            font-size: 14px;
-        }
-        QPushButton#header_button:hover {
-            background-color: rgba(255, 255, 255, 0.2);
-        }
-        QPushButton#header_button:pressed {
-            background-color: rgba(255, 255, 255, 0.3);
-        }
-        /* Tab Widget */
-        QTabWidget {
-            background-color: transparent;
-        }
-        QTabWidget::pane {
-            border: 2px solid #3d5a8c;
-            background-color: #2a3441;
-            border-radius: 8px;
-            margin-top: 20px;
-        }
-        QTabBar::tab {
-            min-width: 160px;
-            min-height: 50px;
-            padding: 12px 20px;
-            margin: 2px;
-            background-color: #3d5a8c;
-            border: none;
-            border-radius: 8px 8px 0 0;
-            font-size: 14px;
-            font-weight: 600;
-            color: white;
-        }
-        QTabBar::tab:selected {
-            background-color: #2c5aa0;
-            color: white;
-        }
-        QTabBar::tab:hover:!selected {
-            background-color: #4a6ba8;
-        }
-        /* Status Bar */
-        QStatusBar {
-            background-color: #1a2332;
-            color: white;
-            border-top: 1px solid #3d5a8c;
-        }
-        """
-        self.setStyleSheet(style)
+        global _TRAY_AVAILABLE
+        if _TRAY_AVAILABLE is None:
+            _TRAY_AVAILABLE = QSystemTrayIcon.isSystemTrayAvailable()
+        if not _TRAY_AVAILABLE:
+            return
+        self.tray_icon = QSystemTrayIcon(self)
+        self.tray_icon.setToolTip("Hunt Pro - Professional Hunting Assistant")
+        # Create tray menu
+        tray_menu = QMenu()
+        show_action = QAction("Show Hunt Pro", self)
+        show_action.triggered.connect(self.show)
+        tray_menu.addAction(show_action)
+        tray_menu.addSeparator()
+        quit_action = QAction("Quit", self)
+        quit_action.triggered.connect(QApplication.quit)
+        tray_menu.addAction(quit_action)
+        self.tray_icon.setContextMenu(tray_menu)
+        self.tray_icon.show()
     def _load_modules(self):
-        """Load all modules in the background."""
+        """Create module tabs and load the modules enabled for startup.
+
+        Remaining modules keep a placeholder tab and are imported the first
+        time the user opens it.
+        """
         self.status_bar.showMessage("Loading modules...")
-        self.module_manager.load_all_modules(self)
+        available = self.module_manager.available_modules
+        self.tab_widget.setUpdatesEnabled(False)
+        self.tab_widget.blockSignals(True)
+        try:
+            for module_name in available:
+                placeholder = QWidget()
+                placeholder.setProperty("hp_module_name", module_name)
+                self._module_placeholders[module_name] = placeholder
+                self.tab_widget.addTab(placeholder, self.module_manager.get_label(module_name))
+        finally:
+            self.tab_widget.blockSignals(False)
+            self.tab_widget.setUpdatesEnabled(True)
+        # Startup modules are imported on worker threads and attached as each
+        # import completes, so the window keeps painting meanwhile
+        startup_modules = [name for name in available if self._loads_at_startup(name)]
+        self.module_manager.load_all_modules_async(self, startup_modules)
+        # Import the lazily loaded modules in parallel while the window idles
+        self.module_manager.prefetch_in_background(
+            name for name in available if name not in startup_modules
+        )
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+        self._on_tab_changed(self.tab_widget.currentIndex())
+    def _loads_at_startup(self, module_name: str) -> bool:
+        """Return whether ``module_name`` should load before its tab is opened."""
+        if module_name not in STARTUP_MODULE_DESCRIPTIONS:
+            return False
+        return _read_bool(self.settings, f'modules/{module_name}', True)
+    def _on_tab_changed(self, index: int):
+        """Load the module behind a placeholder tab when it is first shown."""
+        widget = self.tab_widget.widget(index)
+        if widget is None:
+            return
+        # Placeholders carry their module name, so no scan is needed to find it
+        module_name = widget.property("hp_module_name")
+        if module_name in self._module_placeholders and module_name not in self.module_manager.failed_modules:
+            self.module_manager.load_module(module_name, self)
+    @Slot(str, object)
     def _on_module_loaded(self, module_name: str, module_instance: BaseModule):
         """Handle module loaded event."""
-        module_info = self.module_manager.get_module_info(module_name)
-        if module_info:
-            display_name = module_info['display_name']
-            icon = module_info.get('icon', 'TAB')
-            self.tab_widget.addTab(module_instance, f"{icon} {display_name}")
-            self.logger.info(f"Added tab for module: {module_name}")
+        label = self.module_manager.get_label(module_name)
+        if label is None:
+            return
+        placeholder = self._module_placeholders.pop(module_name, None)
+        index = self.tab_widget.indexOf(placeholder) if placeholder is not None else -1
+        # Swapping the current tab would otherwise re-enter _on_tab_changed
+        signals_blocked = self.tab_widget.blockSignals(True)
+        try:
+            if index >= 0:
+                was_current = self.tab_widget.currentIndex() == index
+                self.tab_widget.removeTab(index)
+                self.tab_widget.insertTab(index, module_instance, label)
+                if was_current:
+                    self.tab_widget.setCurrentIndex(index)
+                placeholder.deleteLater()
+            else:
+                self.tab_widget.addTab(module_instance, label)
+        finally:
+            self.tab_widget.blockSignals(signals_blocked)
+        self.logger.info("Added tab for module: %s", args=(module_name,))
+    @Slot(str, str)
     def _on_module_failed(self, module_name: str, error_message: str):
         """Handle module failed event."""
-        self.logger.error(f"Module {module_name} failed to load: {error_message}")
+        self.logger.error("Module %s failed to load: %s", args=(module_name, error_message))
         self.status_bar.showMessage(f"Failed to load {module_name}: {error_message}", 5000)
+    @Slot()
     def _on_all_modules_loaded(self):
         """Handle all modules loaded event."""
+        # The summary below supersedes any progress message still pending
+        self._progress_timer.stop()
+        self._pending_progress = None
+        self.progress_bar.hide()
         loaded_count = len(self.module_manager.modules)
         failed_count = len(self.module_manager.failed_modules)
-        if failed_count > 0:
-            self.status_bar.showMessage(f"Loaded {loaded_count} modules ({failed_count} failed)")
-        else:
-            self.status_bar.showMessage(f"All {loaded_count} modules loaded successfully")
-        self.logger.info(f"Module loading complete: {loaded_count} loaded, {failed_count} failed")
+        self.status_bar.showMessage(
+            f"Loaded {loaded_count} modules ({failed_count} failed)" if failed_count
+            else f"All {loaded_count} modules loaded successfully"
+        )
+        self.logger.info(
+            "Module loading complete: %d loaded, %d failed", args=(loaded_count, failed_count)
+        )
+    @Slot(int, str)
     def _on_loading_progress(self, progress: int, status: str):
         """Handle loading progress updates."""
-        self.status_bar.showMessage(f"{status} ({progress}%)")
+        self.progress_bar.setValue(progress)
+        # The status text only names the current module, so it changes less
+        # often than the percentage
+        self._pending_progress = status
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    def _flush_progress(self):
+        """Show the most recent progress message, if it changed."""
+        message, self._pending_progress = self._pending_progress, None
+        if message is not None and message != self.status_bar.currentMessage():
+            self.status_bar.showMessage(message)
     def show_settings(self):
         """Show application settings dialog."""
         dialog = SettingsDialog(self, self.settings)
@@ -985,41 +1442,77 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage('Settings updated', 5000)
     def show_about(self):
         """Show about dialog."""
-        about_text = """
-        <h2>Hunt Pro</h2>
-        <p><b>Professional Hunting Assistant</b></p>
-        <p>Version 2.0.0 - Touch-Optimized Field Edition</p>
-        <p>Hunt Pro is a comprehensive hunting companion application featuring:</p>
-        <ul>
-        <li>Advanced ballistics calculations</li>
-        <li>GPS navigation and mapping</li>
-        <li>Game logging and tracking</li>
-        <li>Environmental field tools</li>
-        <li>Advanced tactical equipment</li>
-        </ul>
-        <p>Designed for professional hunters and outdoor enthusiasts.</p>
-        """
-        QMessageBox.about(self, "About Hunt Pro", about_text)
+        QMessageBox.about(self, "About Hunt Pro", self._ABOUT_HTML)
     def closeEvent(self, event):
         """Handle window close event."""
-        if hasattr(self, 'tray_icon') and self.tray_icon.isVisible():
-            QMessageBox.information(
-                self, "Hunt Pro",
-                "Hunt Pro will continue running in the system tray. "
-                "Right-click the tray icon to quit."
-            )
+        if self.tray_icon is not None and self.tray_icon.isVisible():
+            QMessageBox.information(self, "Hunt Pro", self._TRAY_NOTICE)
             self.hide()
             event.ignore()
         else:
             self.save_window_state()
-            # Cleanup modules
-            for module in self.module_manager.modules.values():
-                module.cleanup()
+            self._cleanup_modules()
             event.accept()
+    def _cleanup_modules(self):
+        """Clean up modules, overlapping their shutdown I/O."""
+        modules = list(self.module_manager.modules.values())
+        if not modules:
+            return
+        # Widget and timer teardown stays on the GUI thread
+        for module in modules:
+            module.cleanup()
+        executor = ThreadPoolExecutor(max_workers=min(8, len(modules)))
+        futures = {executor.submit(module.cleanup_io): module for module in modules}
+        done, not_done = wait(futures, timeout=self.CLEANUP_TIMEOUT)
+        # Stragglers keep running; the interpreter joins them before exiting
+        executor.shutdown(wait=False)
+        for future in done:
+            if future.exception() is not None:
+                self.logger.error(
+                    f"Failed to save {futures[future].module_name} data during shutdown",
+                    exception=future.exception(),
+                )
+        for future in not_done:
+            self.logger.warning(
+                f"Timed out waiting for {futures[future].module_name} to save its data"
+            )
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._saved_window_state is None:
+            # Restoring and showing the window deliver move/resize events of
+            # their own; snapshot once they have settled.
+            QTimer.singleShot(0, self._mark_window_state_saved)
+    def _mark_window_state_saved(self):
+        self._saved_window_state = (self.saveGeometry().data(), self.saveState().data())
+        self._geom_dirty = False
+    def moveEvent(self, event):
+        self._geom_dirty = True
+        super().moveEvent(event)
+    def resizeEvent(self, event):
+        self._geom_dirty = True
+        super().resizeEvent(event)
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange:
+            self._geom_dirty = True
+        super().changeEvent(event)
     def save_window_state(self):
-        """Save window geometry and state."""
-        self.settings.setValue("geometry", self.saveGeometry())
-        self.settings.setValue("windowState", self.saveState())
+        """Save window geometry and state if they changed since the last save."""
+        if not self._geom_dirty:
+            return
+        self._geom_dirty = False
+        geometry = self.saveGeometry()
+        state = self.saveState()
+        # Moving the window away and back leaves nothing to write
+        snapshot = (geometry.data(), state.data())
+        if snapshot == self._saved_window_state:
+            return
+        self._saved_window_state = snapshot
+        # Captured now, written and synced on the settings writer thread so the
+        # close is not held up by disk I/O.
+        SettingsWriter.instance().enqueue(self.settings, {
+            "geometry": geometry,
+            "windowState": state,
+        })
     def restore_window_state(self):
         """Restore window geometry and state."""
         geometry = self.settings.value("geometry")
@@ -1043,10 +1536,16 @@ def main():
     app.setApplicationVersion("2.0.0")
     app.setOrganizationName("HuntPro")
     app.setOrganizationDomain("huntpro.app")
+    # Room for the splash artwork and module assets (limit is in KB)
+    QPixmapCache.setCacheLimit(10240)
+    apply_theme(app)
     # Show loading screen
     loading_screen = LoadingScreen()
     loading_screen.show()
-    app.processEvents()
+    # showMessage() repaints the splash immediately; no separate event pump needed
+    loading_screen.showMessage(
+        "Starting Hunt Pro...", Qt.AlignBottom | Qt.AlignHCenter, QColor("white")
+    )
     try:
         # Create main window
         main_window = MainWindow()
@@ -2,19 +2,33 @@
 
 from __future__ import annotations
 
+import atexit
 import base64
+import http.client
 import json
 import math
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Dict, Optional
-from urllib.error import HTTPError, URLError
-from urllib.request import urlopen
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
 
 from logger import LoggableMixin
 
+try:  # NumPy speeds up batch coordinate conversion but is not required.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
 
 class TileSource(Enum):
     """Origin of a map tile image."""
@@ -35,16 +49,65 @@ class CachedTile:
     key: str
     path: Path
     source: TileSource
-    last_updated: datetime
+    last_updated_epoch: float
+
+    @property
+    def last_updated(self) -> datetime:
+        """When the tile was stored, converted from the epoch timestamp on access."""
+
+        return datetime.fromtimestamp(self.last_updated_epoch)
 
 
 TileFetcher = Callable[[int, int, int, str], Optional[bytes]]
+TileRequest = Tuple[int, int, int, str]
 
 # A tiny 1x1 PNG that we upscale inside the UI when no real tile data exists.
 _FALLBACK_TILE_BYTES = base64.b64decode(
     "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGNgYAAAAAMAAWgmWQ0AAAAASUVORK5CYII="
 )
 
+_MANIFEST_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS tiles ("
+    "key TEXT PRIMARY KEY, source TEXT NOT NULL, last_updated REAL NOT NULL)"
+)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` so readers never see a partial file."""
+
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _iso_to_epoch(value: object) -> float:
+    """Convert a legacy ISO timestamp to epoch seconds, or 0 when unknown."""
+
+    if not isinstance(value, str):
+        return 0.0
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (ValueError, OverflowError, OSError):
+        return 0.0
+
+
+# Caches with unsaved manifest changes are flushed when the interpreter exits.
+_live_caches: "weakref.WeakSet[MapTileCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_caches() -> None:
+    for cache in list(_live_caches):
+        cache.flush_manifest()
+
 
 class MapTileCache(LoggableMixin):
     """Manage map tile downloads and provide offline fallbacks."""
@@ -56,6 +119,15 @@ class MapTileCache(LoggableMixin):
         "terrain": "https://tile.openstreetmap.org/{z}/{x}/{y}.png",
         "compass": "https://tile.openstreetmap.org/{z}/{x}/{y}.png",
     }
+    # The OpenStreetMap tile usage policy requires an identifying User-Agent.
+    USER_AGENT = "HuntPro/1.0 map-tile-cache"
+    # Minimum number of seconds between manifest commits while tiles stream in.
+    MANIFEST_FLUSH_INTERVAL = 2.0
+    # Number of recently used tiles answered without touching the disk.
+    MEMORY_CACHE_SIZE = 512
+    # Seconds a tile that failed to download is served as the placeholder
+    # before the network is tried again.
+    FALLBACK_RETRY_INTERVAL = 60.0
 
     def __init__(
         self,
@@ -63,36 +135,134 @@ class MapTileCache(LoggableMixin):
         tile_fetcher: Optional[TileFetcher] = None,
         fallback_bytes: bytes = _FALLBACK_TILE_BYTES,
         timeout: float = 3.0,
+        max_workers: int = 8,
     ) -> None:
         super().__init__()
         self.cache_dir = cache_dir or Path.home() / "HuntPro" / "map_tiles"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self._manifest_file = self.cache_dir / "manifest.json"
-        self._manifest: Dict[str, Dict[str, str]] = {}
-        self._load_manifest()
+        self._cache_root = os.fspath(self.cache_dir)
+        self._manifest_file = self.cache_dir / "tiles.db"
+        self._manifest_dirty = False
+        self._last_flush = -math.inf
+        # Guards the manifest connection, which batch downloads share with the
+        # calling thread.
+        self._lock = threading.RLock()
+        self._db = self._open_manifest()
+        self._recent_tiles: "OrderedDict[str, CachedTile]" = OrderedDict()
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Keep-alive connections for the default fetcher, one set per thread
+        # because ``http.client`` connections are not thread-safe.
+        self._local = threading.local()
+        self._connections: List[http.client.HTTPConnection] = []
+        _live_caches.add(self)
+        self._import_legacy_manifest()
         self.tile_fetcher: TileFetcher = tile_fetcher or self._default_fetcher
         self._fallback_bytes = fallback_bytes
         self.timeout = timeout
+        # Every failed tile points at one shared placeholder image on disk.
+        self._fallback_path = self.cache_dir / "_fallback.png"
+        self._write_fallback_tile()
+        self._failed_tiles: Dict[str, float] = {}
+        # Downloads in progress, so concurrent requests for a tile share one.
+        self._inflight: Dict[str, "Future[CachedTile]"] = {}
+        self._shard_flat_tiles()
+
+    def _shard_flat_tiles(self) -> None:
+        """Move tiles saved as ``mode_z_x_y.png`` into the sharded layout."""
+
+        moved = 0
+        for flat_path in self.cache_dir.glob("*_*_*_*.png"):
+            mode, *coordinates = flat_path.stem.rsplit("_", 3)
+            if not mode or not all(part.isdigit() for part in coordinates):
+                continue
+            zoom, x, y = (int(part) for part in coordinates)
+            target = self._tile_path(zoom, x, y, mode)
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                flat_path.replace(target)
+            except OSError as exc:
+                self.log_warning("Failed to move cached tile", exception=exc, path=str(flat_path))
+                continue
+            moved += 1
+        if moved:
+            self.log_info("Moved cached tiles into sharded directories", tiles=moved)
+
+    def _write_fallback_tile(self) -> None:
+        try:
+            if not self._fallback_path.exists() or self._fallback_path.read_bytes() != self._fallback_bytes:
+                _write_atomic(self._fallback_path, self._fallback_bytes)
+        except OSError as exc:
+            self.log_warning("Failed to write offline placeholder tile", exception=exc)
 
     # ------------------------------------------------------------------
     # Manifest handling
     # ------------------------------------------------------------------
-    def _load_manifest(self) -> None:
-        if not self._manifest_file.exists():
-            self._manifest = {}
+    def _open_manifest(self) -> sqlite3.Connection:
+        try:
+            db = sqlite3.connect(self._manifest_file, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(_MANIFEST_SCHEMA)
+            db.commit()
+        except sqlite3.Error as exc:
+            self.log_warning("Failed to open map tile manifest, using a temporary one", exception=exc)
+            db = sqlite3.connect(":memory:", check_same_thread=False)
+            db.execute(_MANIFEST_SCHEMA)
+        return db
+
+    def _import_legacy_manifest(self) -> None:
+        """Move entries from the old ``manifest.json`` into the database once."""
+
+        legacy_file = self.cache_dir / "manifest.json"
+        if not legacy_file.exists():
             return
         try:
-            data = json.loads(self._manifest_file.read_text())
-            self._manifest = data if isinstance(data, dict) else {}
+            data = json.loads(legacy_file.read_text())
         except (json.JSONDecodeError, OSError) as exc:
-            self.log_warning("Failed to read map tile manifest", exception=exc)
-            self._manifest = {}
-
-    def _save_manifest(self) -> None:
+            self.log_warning("Failed to read legacy map tile manifest", exception=exc)
+            return
+        rows = [
+            (key, entry.get("source", TileSource.CACHE.value), _iso_to_epoch(entry.get("last_updated")))
+            for key, entry in (data.items() if isinstance(data, dict) else ())
+            if isinstance(entry, dict)
+        ]
+        with self._lock:
+            try:
+                self._db.executemany("INSERT OR IGNORE INTO tiles VALUES (?, ?, ?)", rows)
+                self._db.commit()
+            except sqlite3.Error as exc:
+                self.log_warning("Failed to import legacy map tile manifest", exception=exc)
+                return
         try:
-            self._manifest_file.write_text(json.dumps(self._manifest, indent=2))
+            legacy_file.unlink()
         except OSError as exc:
-            self.log_warning("Failed to persist map tile manifest", exception=exc)
+            self.log_warning("Failed to remove legacy map tile manifest", exception=exc)
+        self.log_info("Imported legacy map tile manifest", entries=len(rows))
+
+    def _save_manifest(self) -> None:
+        with self._lock:
+            try:
+                self._db.commit()
+            except sqlite3.Error as exc:
+                self.log_warning("Failed to persist map tile manifest", exception=exc)
+                return
+            self._manifest_dirty = False
+            self._last_flush = time.monotonic()
+
+    def _maybe_flush_manifest(self) -> None:
+        """Commit manifest changes if the flush interval has passed."""
+
+        with self._lock:
+            if self._manifest_dirty and time.monotonic() - self._last_flush >= self.MANIFEST_FLUSH_INTERVAL:
+                self._save_manifest()
+
+    def flush_manifest(self) -> None:
+        """Commit any manifest changes that are still pending."""
+
+        with self._lock:
+            if self._manifest_dirty:
+                self._save_manifest()
 
     # ------------------------------------------------------------------
     # Tile operations
@@ -100,8 +270,13 @@ class MapTileCache(LoggableMixin):
     def _tile_key(self, zoom: int, x: int, y: int, mode: str) -> str:
         return f"{mode}_{zoom}_{x}_{y}"
 
-    def _tile_path(self, key: str) -> Path:
-        return self.cache_dir / f"{key}.png"
+    def _tile_file(self, zoom: int, x: int, y: int, mode: str) -> str:
+        # Sharded as mode/z/x/y.png so no single directory grows unbounded.
+        # Built as a plain string because lookups only need it for os calls.
+        return os.path.join(self._cache_root, mode, str(zoom), str(x), f"{y}.png")
+
+    def _tile_path(self, zoom: int, x: int, y: int, mode: str) -> Path:
+        return Path(self._tile_file(zoom, x, y, mode))
 
     def coordinate_to_tile(self, latitude: float, longitude: float, zoom: int) -> tuple[int, int]:
         """Convert WGS84 coordinates to the XYZ tile space."""
@@ -112,22 +287,118 @@ class MapTileCache(LoggableMixin):
         y = int((1.0 - math.log(math.tan(lat_rad) + 1 / math.cos(lat_rad)) / math.pi) / 2.0 * n)
         return x, y
 
+    def coordinates_to_tiles(
+        self,
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        zoom: int,
+    ) -> Tuple[List[int], List[int]]:
+        """Convert many WGS84 coordinates to XYZ tiles, returning ``(xs, ys)``.
+
+        Uses NumPy when it is installed so a whole viewport is converted in one
+        vectorized pass; otherwise each point goes through
+        :meth:`coordinate_to_tile`.
+        """
+
+        if np is None:
+            tiles = [self.coordinate_to_tile(lat, lon, zoom) for lat, lon in zip(latitudes, longitudes)]
+            return [x for x, _ in tiles], [y for _, y in tiles]
+        lat_rad = np.radians(np.asarray(latitudes, dtype=float))
+        n = 2.0 ** zoom
+        xs = ((np.asarray(longitudes, dtype=float) + 180.0) / 360.0 * n).astype(int)
+        ys = ((1.0 - np.log(np.tan(lat_rad) + 1 / np.cos(lat_rad)) / np.pi) / 2.0 * n).astype(int)
+        return xs.tolist(), ys.tolist()
+
     def get_tile(self, zoom: int, x: int, y: int, mode: str) -> CachedTile:
         """Return a cached tile, downloading it if necessary."""
 
         mode_key = mode.lower()
+        tile = self._cached_tile(zoom, x, y, mode_key)
+        if tile is None:
+            tile = self._download_tile(zoom, x, y, mode_key)
+            self._maybe_flush_manifest()
+        return tile
+
+    def get_tiles(self, requests: Iterable[TileRequest]) -> List[CachedTile]:
+        """Return the tiles for several ``(zoom, x, y, mode)`` requests in order.
+
+        Cached tiles are returned straight away. Missing tiles are downloaded
+        concurrently and the manifest is written at most once for the batch.
+        """
+
+        requests = [(zoom, x, y, mode.lower()) for zoom, x, y, mode in requests]
+        tiles: List[Optional[CachedTile]] = [None] * len(requests)
+        # Duplicate requests for one missing tile share a single download.
+        misses: Dict[str, List[int]] = {}
+        for index, request in enumerate(requests):
+            key = self._tile_key(*request)
+            if key in misses:
+                misses[key].append(index)
+                continue
+            tile = self._cached_tile(*request)
+            if tile is None:
+                misses[key] = [index]
+            else:
+                tiles[index] = tile
+
+        if misses:
+            pending = [requests[indexes[0]] for indexes in misses.values()]
+            downloaded = self._get_executor().map(lambda request: self._download_tile(*request), pending)
+            for indexes, tile in zip(misses.values(), downloaded):
+                for index in indexes:
+                    tiles[index] = tile
+            self._maybe_flush_manifest()
+        return [tile for tile in tiles if tile is not None]
+
+    def close(self) -> None:
+        """Stop the download workers, save the manifest, and close connections."""
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.flush_manifest()
+        with self._lock:
+            self._db.close()
+        _live_caches.discard(self)
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="map-tile",
+                )
+            return self._executor
+
+    def _remember_tile(self, tile: CachedTile) -> None:
+        with self._lock:
+            self._recent_tiles[tile.key] = tile
+            self._recent_tiles.move_to_end(tile.key)
+            if len(self._recent_tiles) > self.MEMORY_CACHE_SIZE:
+                self._recent_tiles.popitem(last=False)
+
+    def _cached_tile(self, zoom: int, x: int, y: int, mode_key: str) -> Optional[CachedTile]:
         key = self._tile_key(zoom, x, y, mode_key)
-        tile_path = self._tile_path(key)
-
-        if key in self._manifest and tile_path.exists():
-            entry = self._manifest[key]
-            stored_source = entry.get("source", TileSource.CACHE.value)
+        with self._lock:
+            tile = self._recent_tiles.get(key)
+            if tile is not None:
+                self._recent_tiles.move_to_end(key)
+                return tile
+
+        tile_file = self._tile_file(zoom, x, y, mode_key)
+        with self._lock:
+            row = self._db.execute("SELECT source, last_updated FROM tiles WHERE key = ?", (key,)).fetchone()
+        if row is not None and os.path.exists(tile_file):
+            stored_source, last_updated = row
             source = TileSource.FALLBACK if stored_source == TileSource.FALLBACK.value else TileSource.CACHE
-            timestamp_str = entry.get("last_updated")
-            try:
-                timestamp = datetime.fromisoformat(timestamp_str) if timestamp_str else datetime.fromtimestamp(tile_path.stat().st_mtime)
-            except (ValueError, OSError):
-                timestamp = datetime.fromtimestamp(tile_path.stat().st_mtime)
+            # Legacy rows without a timestamp fall back to the file's mtime.
+            timestamp = last_updated or os.stat(tile_file).st_mtime
             self.log_debug(
                 "Loaded tile from cache",
                 source=source.value,
@@ -136,14 +407,60 @@ class MapTileCache(LoggableMixin):
                 y=y,
                 mode=mode_key,
             )
-            return CachedTile(key=key, path=tile_path, source=source, last_updated=timestamp)
+            tile = CachedTile(key=key, path=Path(tile_file), source=source, last_updated_epoch=timestamp)
+            self._remember_tile(tile)
+            return tile
+        return None
+
+    def _download_tile(self, zoom: int, x: int, y: int, mode_key: str) -> CachedTile:
+        """Fetch a tile, waiting on a download already running for it."""
 
+        key = self._tile_key(zoom, x, y, mode_key)
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                # Another caller may have finished the download since our miss.
+                tile = self._recent_tiles.get(key)
+                if tile is not None:
+                    return tile
+                future = self._inflight[key] = Future()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            return future.result()
+        try:
+            tile = self._fetch_tile(zoom, x, y, mode_key)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(tile)
+        finally:
+            with self._lock:
+                del self._inflight[key]
+        return tile
+
+    def _fetch_tile(self, zoom: int, x: int, y: int, mode_key: str) -> CachedTile:
+        """Fetch a tile and record it in the manifest without saving it.
+
+        Failed downloads return the shared placeholder and are not recorded, so
+        the tile is fetched again once ``FALLBACK_RETRY_INTERVAL`` has passed.
+        """
+
+        key = self._tile_key(zoom, x, y, mode_key)
+        with self._lock:
+            failed_at = self._failed_tiles.get(key)
+        if failed_at is not None and time.monotonic() - failed_at < self.FALLBACK_RETRY_INTERVAL:
+            return self._fallback_tile(key)
+
+        tile_path = self._tile_path(zoom, x, y, mode_key)
         try:
             payload = self.tile_fetcher(zoom, x, y, mode_key)
             if not payload:
                 raise TileFetchError("empty tile payload")
-            tile_path.write_bytes(payload)
-            source = TileSource.NETWORK
+            tile_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(tile_path, payload)
             self.log_info(
                 "Downloaded tile and cached for offline use",
                 zoom=zoom,
@@ -161,30 +478,81 @@ class MapTileCache(LoggableMixin):
                 y=y,
                 mode=mode_key,
             )
-            tile_path.write_bytes(self._fallback_bytes)
-            source = TileSource.FALLBACK
-
-        timestamp = datetime.now()
-        self._manifest[key] = {
-            "source": source.value,
-            "last_updated": timestamp.isoformat(),
-        }
-        self._save_manifest()
-        return CachedTile(key=key, path=tile_path, source=source, last_updated=timestamp)
+            with self._lock:
+                self._failed_tiles[key] = time.monotonic()
+            return self._fallback_tile(key)
+
+        timestamp = time.time()
+        with self._lock:
+            self._failed_tiles.pop(key, None)
+            self._db.execute(
+                "INSERT OR REPLACE INTO tiles (key, source, last_updated) VALUES (?, ?, ?)",
+                (key, TileSource.NETWORK.value, timestamp),
+            )
+            self._manifest_dirty = True
+        # Later lookups of a downloaded tile report it as served from the cache.
+        self._remember_tile(CachedTile(key=key, path=tile_path, source=TileSource.CACHE, last_updated_epoch=timestamp))
+        return CachedTile(key=key, path=tile_path, source=TileSource.NETWORK, last_updated_epoch=timestamp)
+
+    def _fallback_tile(self, key: str) -> CachedTile:
+        return CachedTile(
+            key=key,
+            path=self._fallback_path,
+            source=TileSource.FALLBACK,
+            last_updated_epoch=time.time(),
+        )
 
     # ------------------------------------------------------------------
     # Default network fetcher
     # ------------------------------------------------------------------
     def _default_fetcher(self, zoom: int, x: int, y: int, mode: str) -> Optional[bytes]:
         template = self.DEFAULT_TILE_SERVERS.get(mode) or self.DEFAULT_TILE_SERVERS["map"]
-        url = template.format(z=zoom, x=x, y=y, mode=mode)
-        try:
-            with urlopen(url, timeout=self.timeout) as response:
-                if response.status != 200:
-                    raise TileFetchError(f"unexpected status code: {response.status}")
-                return response.read()
-        except (URLError, HTTPError) as exc:
-            raise TileFetchError(str(exc)) from exc
+        parts = urlsplit(template.format(z=zoom, x=x, y=y, mode=mode))
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        headers = {"User-Agent": self.USER_AGENT}
+        # A pooled connection may have been closed by the server while idle;
+        # retry once on a fresh connection before giving up.
+        for attempt in range(2):
+            connection = self._get_connection(parts.scheme, parts.netloc)
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                payload = response.read()
+            except (http.client.HTTPException, OSError) as exc:
+                self._drop_connection(parts.scheme, parts.netloc)
+                if attempt or not isinstance(exc, (http.client.RemoteDisconnected, ConnectionError)):
+                    raise TileFetchError(str(exc)) from exc
+                continue
+            if response.will_close:
+                self._drop_connection(parts.scheme, parts.netloc)
+            if response.status != 200:
+                raise TileFetchError(f"unexpected status code: {response.status}")
+            return payload
+        return None
+
+    def _get_connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """Return this thread's keep-alive connection to ``netloc``."""
+
+        pool: Optional[Dict[Tuple[str, str], http.client.HTTPConnection]] = getattr(self._local, "pool", None)
+        if pool is None:
+            pool = self._local.pool = {}
+        connection = pool.get((scheme, netloc))
+        if connection is None:
+            factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            connection = factory(netloc, timeout=self.timeout)
+            pool[(scheme, netloc)] = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _drop_connection(self, scheme: str, netloc: str) -> None:
+        pool = getattr(self._local, "pool", {})
+        connection = pool.pop((scheme, netloc), None)
+        if connection is not None:
+            connection.close()
+            with self._lock:
+                if connection in self._connections:
+                    self._connections.remove(connection)
 
 
 __all__ = ["MapTileCache", "TileSource", "CachedTile", "TileFetchError"]
@@ -5,8 +5,12 @@ import shutil
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, List, Optional
 from logger import get_logger
+try:  # orjson parses large stores several times faster
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 class MigrationError(Exception):
     """Raised when a migration cannot be completed safely."""
 @dataclass
@@ -15,12 +19,29 @@ class MigrationOutcome:
     previous_version: int
     new_version: int
     backup_path: Optional[Path]
+def _loads(data: Any) -> Any:
+    """Parse a JSON document, preferring orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The stdlib also accepts NaN/Infinity, which json.dump writes;
+            # genuinely invalid documents raise json.JSONDecodeError below.
+            pass
+    return json.loads(data)
+def _dumps(payload: Any) -> bytes:
+    """Serialize ``payload`` as sorted, two-space indented UTF-8 JSON.
+
+    Writes stay on the stdlib: orjson turns NaN and infinities into ``null``,
+    while json.dumps round-trips them the way the stores were always written.
+    """
+    return json.dumps(payload, indent=2, ensure_ascii=False, sort_keys=True).encode("utf-8")
 def _write_json_atomic(target: Path, payload: Dict[str, Any]) -> None:
     """Write JSON data to ``target`` using a temporary file for safety."""
     target = Path(target)
     tmp_path = target.with_suffix(target.suffix + ".tmp")
-    with tmp_path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, ensure_ascii=False, sort_keys=True)
+    with tmp_path.open("wb") as handle:
+        handle.write(_dumps(payload))
     tmp_path.replace(target)
 def _create_backup(
     source: Path,
@@ -50,8 +71,13 @@ def migrate_game_log_store(
     validator: Any,
     target_version: Optional[int] = None,
     logger=None,
+    on_validated: Optional[Callable[[int, Any], None]] = None,
 ) -> Optional[MigrationOutcome]:
-    """Upgrade the game log JSON document to the latest supported schema."""
+    """Upgrade the game log JSON document to the latest supported schema.
+
+    ``on_validated`` receives the schema version and normalized entries of the
+    document left on disk, so callers can load it without validating again.
+    """
     file_path = Path(file_path)
     if target_version is None:
         target_version = int(getattr(validator, "CURRENT_VERSION"))
@@ -60,8 +86,8 @@ def migrate_game_log_store(
     if not file_path.exists():
         return None
     try:
-        with file_path.open("r", encoding="utf-8") as handle:
-            raw_data: Any = json.load(handle)
+        # Parsed straight from bytes, skipping a text decoding pass and copy
+        raw_data: Any = _loads(file_path.read_bytes())
     except json.JSONDecodeError as exc:
         raise MigrationError(
             f"Game log file '{file_path}' contains invalid JSON"
@@ -87,6 +113,8 @@ def migrate_game_log_store(
         and raw_data.get("entries") != normalized_entries
     )
     if not requires_rewrite:
+        if on_validated is not None:
+            on_validated(schema_version, normalized_entries)
         return None
     timestamp = datetime.now(timezone.utc).isoformat()
     document: Dict[str, Any] = {
@@ -101,6 +129,9 @@ def migrate_game_log_store(
         file_path, prefix="game-log", version=schema_version, backup_dir=file_path.parent
     )
     _write_json_atomic(file_path, document)
+    if on_validated is not None:
+        # The rewritten document is already normalized at the target version
+        on_validated(target_version, normalized_entries)
     logger.info(
         "Migrated game log storage",
         previous_version=schema_version,
@@ -128,8 +159,8 @@ def migrate_ballistic_profile_store(
     if not file_path.exists():
         return None
     try:
-        with file_path.open("r", encoding="utf-8") as handle:
-            raw_data: Any = json.load(handle)
+        # Parsed straight from bytes, skipping a text decoding pass and copy
+        raw_data: Any = _loads(file_path.read_bytes())
     except json.JSONDecodeError as exc:
         raise MigrationError(
             f"Ballistic profile store '{file_path}' contains invalid JSON"
@@ -139,7 +170,7 @@ def migrate_ballistic_profile_store(
             f"Unable to read ballistic profile store '{file_path}': {exc}"
         ) from exc
     current_version = 0
-    raw_profiles: Iterable[Dict[str, Any]]
+    raw_profiles: List[Dict[str, Any]]
     if isinstance(raw_data, dict):
         current_version = int(raw_data.get("version", 0))
         if "profiles" in raw_data and isinstance(raw_data["profiles"], list):
@@ -162,15 +193,19 @@ def migrate_ballistic_profile_store(
         raise MigrationError(
             f"Ballistic profile store '{file_path}' has an unsupported structure"
         )
-    normalized_profiles = [dumper(loader(entry)) for entry in raw_profiles]
     requires_migration = current_version != target_version
-    requires_rewrite = requires_migration or list(raw_profiles) != normalized_profiles
-    if not requires_rewrite:
+    # Stores at the target version are only ever written with dumper output
+    # under "profiles", so they are already normalized and need no roundtrip.
+    if (
+        not requires_migration
+        and isinstance(raw_data, dict)
+        and raw_profiles is raw_data.get("profiles")
+    ):
         return None
     payload: Dict[str, Any] = {
         **metadata,
         "version": target_version,
-        "profiles": normalized_profiles,
+        "profiles": [dumper(loader(entry)) for entry in raw_profiles],
     }
     if requires_migration:
         payload["migrated_at"] = datetime.now(timezone.utc).isoformat()
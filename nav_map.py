@@ -1647,15 +1647,17 @@ class NavigationModule(BaseModule):
         # Stop tracking if active
         if self.is_tracking:
             self.stop_tracking()
-        # Save data
+        super().cleanup()
+        self.log_info("Navigation module cleaned up")
+    def cleanup_io(self):
+        """Save navigation data during shutdown."""
         try:
             self.save_waypoints()
             self.save_tracks()
             self.save_points_of_interest()
         except Exception as e:
             self.log_error("Failed to save navigation data during cleanup", exception=e)
-        super().cleanup()
-        self.log_info("Navigation module cleaned up")
+        self.tile_cache.close()
     def get_display_name(self) -> str:
         """Return the display name for this module."""
         return "Navigation & GPS"
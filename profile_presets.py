@@ -0,0 +1,195 @@
+"""Operator profile presets offered by the Hunt Pro settings dialog.
+
+Each preset pins the general, display, and startup-module settings to a known
+configuration. Presets are immutable and slotted so they can be shared freely
+and matched against the dialog state with a single hash lookup.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import astuple, dataclass, fields
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+def _intern_strings(instance: Any) -> None:
+    """Intern every string field so equal values share one object."""
+
+    for field in fields(instance):
+        value = getattr(instance, field.name)
+        if isinstance(value, str):
+            object.__setattr__(instance, field.name, sys.intern(value))
+
+
+@dataclass(frozen=True, slots=True)
+class GeneralPreset:
+    """Values applied to the General tab."""
+
+    primary_region: str
+    log_retention: int
+    auto_backup: bool
+    prompt_before_sync: bool
+    launch_on_start: bool
+    show_tips: bool
+
+    def __post_init__(self) -> None:
+        _intern_strings(self)
+
+
+@dataclass(frozen=True, slots=True)
+class DisplayPreset:
+    """Values applied to the Display tab."""
+
+    theme: str
+    font_scale: int
+    high_contrast: bool
+    distance_units: str
+    temperature_units: str
+
+    def __post_init__(self) -> None:
+        _intern_strings(self)
+
+
+@dataclass(frozen=True, slots=True)
+class ModulesPreset:
+    """Startup module toggles applied to the Modules tab."""
+
+    ballistics: bool
+    nav_map: bool
+    game_log: bool
+
+
+@dataclass(frozen=True, slots=True)
+class ProfilePreset:
+    """A named operator profile."""
+
+    key: str
+    title: str
+    description: str
+    general: GeneralPreset
+    display: DisplayPreset
+    modules: ModulesPreset
+
+    def fingerprint(self) -> Tuple[tuple, tuple, tuple]:
+        """Return the pinned values as a hashable tuple."""
+
+        return astuple(self.general), astuple(self.display), astuple(self.modules)
+
+
+PROFILE_PRESETS: Tuple[ProfilePreset, ...] = (
+    ProfilePreset(
+        key="mountain_marksman",
+        title="Mountain Marksman",
+        description=(
+            "North American big-game preset with resilient offline navigation, "
+            "long retention for harvest logs, and a balanced visual setup."
+        ),
+        general=GeneralPreset(
+            primary_region="North America",
+            log_retention=90,
+            auto_backup=True,
+            prompt_before_sync=True,
+            launch_on_start=True,
+            show_tips=False,
+        ),
+        display=DisplayPreset(
+            theme="Dark",
+            font_scale=105,
+            high_contrast=True,
+            distance_units="Imperial (yards)",
+            temperature_units="Fahrenheit",
+        ),
+        modules=ModulesPreset(ballistics=True, nav_map=True, game_log=True),
+    ),
+    ProfilePreset(
+        key="euro_stalker",
+        title="European Stalker",
+        description=(
+            "Optimized for roaming hunts across European forests with metric "
+            "units and streamlined startup modules."
+        ),
+        general=GeneralPreset(
+            primary_region="Europe",
+            log_retention=60,
+            auto_backup=True,
+            prompt_before_sync=False,
+            launch_on_start=False,
+            show_tips=True,
+        ),
+        display=DisplayPreset(
+            theme="Auto",
+            font_scale=100,
+            high_contrast=False,
+            distance_units="Metric (meters)",
+            temperature_units="Celsius",
+        ),
+        modules=ModulesPreset(ballistics=True, nav_map=True, game_log=False),
+    ),
+    ProfilePreset(
+        key="savanna_outfitter",
+        title="Savanna Outfitter",
+        description=(
+            "High-visibility preset for guided operations in African reserves "
+            "with aggressive backups and enhanced mapping."
+        ),
+        general=GeneralPreset(
+            primary_region="Africa",
+            log_retention=45,
+            auto_backup=True,
+            prompt_before_sync=True,
+            launch_on_start=True,
+            show_tips=True,
+        ),
+        display=DisplayPreset(
+            theme="Light",
+            font_scale=110,
+            high_contrast=True,
+            distance_units="Metric (meters)",
+            temperature_units="Celsius",
+        ),
+        modules=ModulesPreset(ballistics=True, nav_map=True, game_log=True),
+    ),
+)
+
+PROFILE_PRESET_MAP: Mapping[str, ProfilePreset] = MappingProxyType(
+    {preset.key: preset for preset in PROFILE_PRESETS}
+)
+
+_GENERAL_FIELDS = tuple(field.name for field in fields(GeneralPreset))
+_DISPLAY_FIELDS = tuple(field.name for field in fields(DisplayPreset))
+_MODULE_FIELDS = tuple(field.name for field in fields(ModulesPreset))
+
+# Earlier presets win when two share a fingerprint, as with an in-order scan.
+_PRESET_FINGERPRINTS: Dict[tuple, str] = {}
+for _preset in PROFILE_PRESETS:
+    _PRESET_FINGERPRINTS.setdefault(_preset.fingerprint(), _preset.key)
+del _preset
+
+
+def match_profile_preset(settings: Mapping[str, Any]) -> Optional[str]:
+    """Return the key of the preset ``settings`` matches, or ``None``.
+
+    ``settings`` uses the flat layout gathered by the settings dialog, with
+    module toggles nested under ``"modules"``. Keys no preset pins, such as the
+    call sign, are ignored.
+    """
+
+    modules = settings.get("modules", {})
+    fingerprint = (
+        tuple(settings.get(name) for name in _GENERAL_FIELDS),
+        tuple(settings.get(name) for name in _DISPLAY_FIELDS),
+        tuple(modules.get(name) for name in _MODULE_FIELDS),
+    )
+    return _PRESET_FINGERPRINTS.get(fingerprint)
+
+
+__all__ = [
+    "DisplayPreset",
+    "GeneralPreset",
+    "ModulesPreset",
+    "PROFILE_PRESETS",
+    "PROFILE_PRESET_MAP",
+    "ProfilePreset",
+    "match_profile_preset",
+]
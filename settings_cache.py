@@ -0,0 +1,170 @@
+"""In-memory caching layer for Hunt Pro's persistent settings.
+
+``QSettings`` round-trips every ``value``/``setValue`` call through its
+persistent backend (an INI file, plist, or the Windows registry). Dialogs that
+read and write a dozen keys at a time pay that cost per key. The
+:class:`CachedSettings` wrapper keeps values in memory after the first read and
+only pushes keys that actually changed back to the backend on :meth:`flush`.
+
+The wrapper only relies on the ``value``/``setValue``/``sync`` methods (plus
+``beginGroup``/``childKeys``/``endGroup`` for :meth:`CachedSettings.preload`),
+so it works with any ``QSettings``-like object and can be exercised without Qt.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Set
+
+_MISSING = object()
+
+
+def _coerce(value: Any, value_type: Optional[type]) -> Any:
+    """Convert a raw stored value to ``value_type`` the way QSettings does."""
+
+    if value_type is None or isinstance(value, value_type):
+        return value
+    if value_type is bool:
+        # Text backends persist booleans as "true"/"false".
+        if isinstance(value, str):
+            return value.strip().lower() in {"true", "1", "yes", "on"}
+        return bool(value)
+    return value_type(value)
+
+
+def _same_value(stored: Any, value: Any) -> bool:
+    """Return ``True`` when writing ``value`` over ``stored`` would change nothing.
+
+    Text backends hand values back as strings, so a stored ``"45"`` matches a
+    new ``45`` and ``"false"`` matches ``False``.
+    """
+
+    if stored is _MISSING or stored is None:
+        return False
+    if stored == value:
+        return True
+    if isinstance(stored, str) and value is not None and not isinstance(value, str):
+        try:
+            return _coerce(stored, type(value)) == value
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+class CachedSettings:
+    """Read-through, write-back cache around a ``QSettings`` instance.
+
+    When ``group`` is given the wrapper acts as a view onto that group of a
+    shared store, so several components can use one backend without their keys
+    colliding.
+    """
+
+    def __init__(self, backend: Any, group: str = "") -> None:
+        self._backend = backend
+        group = group.strip("/")
+        self._prefix = f"{group}/" if group else ""
+        self._groups: List[str] = []
+        self._cache: Dict[str, Any] = {}
+        self._dirty: Set[str] = set()
+        # Groups whose keys were all read by ``preload``; keys missing from
+        # the cache under them are known to be unset.
+        self._loaded_groups: Set[str] = set()
+
+    @property
+    def backend(self) -> Any:
+        """The wrapped settings store."""
+
+        return self._backend
+
+    def beginGroup(self, prefix: str) -> None:  # noqa: N802 - mirrors QSettings
+        """Resolve subsequent keys relative to ``prefix`` until :meth:`endGroup`."""
+
+        self._groups.append(prefix.strip("/"))
+
+    def endGroup(self) -> None:  # noqa: N802 - mirrors QSettings
+        """Leave the group entered by the matching :meth:`beginGroup` call."""
+
+        if self._groups:
+            self._groups.pop()
+
+    def _key(self, key: str) -> str:
+        return "/".join([*self._groups, key]) if self._groups else key
+
+    def value(self, key: str, default: Any = None, value_type: Optional[type] = None) -> Any:
+        """Return the value stored for ``key`` reading the backend at most once."""
+
+        key = self._key(key)
+        raw = self._cache.get(key, _MISSING)
+        if raw is _MISSING:
+            if key.rpartition("/")[0] in self._loaded_groups:
+                raw = None
+            else:
+                raw = self._backend.value(self._prefix + key)
+            self._cache[key] = raw
+        if raw is None:
+            return default
+        try:
+            return _coerce(raw, value_type)
+        except (TypeError, ValueError):
+            return default
+
+    def preload(self, group: str) -> None:
+        """Read every key stored directly under ``group`` in one pass.
+
+        Later lookups in the group, including keys that are not stored at all,
+        are answered from memory.
+        """
+
+        group = self._key(group.strip("/"))
+        self._backend.beginGroup(self._prefix + group)
+        try:
+            for child in self._backend.childKeys():
+                # Keep locally changed values that have not been flushed yet
+                self._cache.setdefault(f"{group}/{child}", self._backend.value(child))
+        finally:
+            self._backend.endGroup()
+        self._loaded_groups.add(group)
+
+    def setValue(self, key: str, value: Any) -> None:  # noqa: N802 - mirrors QSettings
+        """Record ``value`` for ``key``; the backend is only updated on flush."""
+
+        key = self._key(key)
+        if _same_value(self._cache.get(key, _MISSING), value):
+            return
+        self._cache[key] = value
+        self._dirty.add(key)
+
+    def is_dirty(self) -> bool:
+        """Return ``True`` when there are changes that have not been flushed."""
+
+        return bool(self._dirty)
+
+    def take_changes(self) -> Dict[str, Any]:
+        """Return the unflushed changes, keyed by backend path, and mark them handed off.
+
+        Callers that persist the changes themselves (for example on a
+        background writer) use this instead of :meth:`flush`.
+        """
+
+        changes = {self._prefix + key: self._cache[key] for key in sorted(self._dirty)}
+        self._dirty.clear()
+        return changes
+
+    def flush(self) -> int:
+        """Write changed keys to the backend and return how many were written."""
+
+        changes = self.take_changes()
+        if not changes:
+            return 0
+        for key, value in changes.items():
+            self._backend.setValue(key, value)
+        self._backend.sync()
+        return len(changes)
+
+    def invalidate(self) -> None:
+        """Drop cached reads so the next lookup consults the backend again."""
+
+        self._cache = {key: self._cache[key] for key in self._dirty}
+        self._loaded_groups.clear()
+
+
+__all__ = ["CachedSettings"]
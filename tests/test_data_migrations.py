@@ -1,5 +1,6 @@
 import importlib
 import json
+import math
 import sys
 import types
 from datetime import datetime
@@ -226,3 +227,43 @@ def test_migrate_ballistic_profile_store_from_list(tmp_path: Path):
     migrated_profile = payload["profiles"][0]
     assert "created_at" in migrated_profile
     assert migrated_profile["ammunition"]["drag_model"] == ballistics.DragModel.G1.value
+def test_migrate_ballistic_profile_store_skips_current_store(tmp_path: Path):
+    storage_file = tmp_path / "profiles.json"
+    contents = json.dumps({"version": ballistics.BALLISTIC_PROFILE_SCHEMA_VERSION, "profiles": [{"name": "Current"}]})
+    storage_file.write_text(contents)
+    def loader(entry):
+        raise AssertionError("current store was roundtripped")
+    outcome = migrations.migrate_ballistic_profile_store(
+        storage_file,
+        loader=loader,
+        dumper=lambda profile: profile.to_dict(),
+        target_version=ballistics.BALLISTIC_PROFILE_SCHEMA_VERSION,
+        logger=_StubLogger(),
+    )
+    assert outcome is None
+    assert storage_file.read_text() == contents
+def test_rewritten_store_keeps_non_finite_numbers(tmp_path: Path):
+    target = tmp_path / "store.json"
+    migrations._write_json_atomic(target, {"a": float("nan"), "b": float("inf"), "c": float("-inf")})
+    document = migrations._loads(target.read_bytes())
+    assert math.isnan(document["a"])
+    assert document["b"] == math.inf and document["c"] == -math.inf
+def test_migrate_game_log_store_hands_back_validation_result(tmp_path: Path):
+    class CountingValidator(GameLogValidator):
+        calls = 0
+        @classmethod
+        def validate_document(cls, document):
+            cls.calls += 1
+            return super().validate_document(document)
+    data_file = tmp_path / "game_log.json"
+    data_file.write_text(json.dumps({"schema_version": GameLogValidator.CURRENT_VERSION, "entries": []}))
+    results = []
+    outcome = migrations.migrate_game_log_store(
+        data_file,
+        validator=CountingValidator,
+        logger=_StubLogger(),
+        on_validated=lambda *result: results.append(result),
+    )
+    assert outcome is None
+    assert results == [(GameLogValidator.CURRENT_VERSION, [])]
+    assert CountingValidator.calls == 1
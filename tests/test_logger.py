@@ -1,4 +1,6 @@
-from logger import setup_logger
+import logging
+
+from logger import LogLevel, setup_logger
 
 def test_logger_accepts_string_category(tmp_path):
     log_dir = tmp_path / "logs"
@@ -15,3 +17,35 @@ def test_logger_accepts_string_category(tmp_path):
     assert "String category entry" in content
     assert '"category": "DATA"' in content
     assert '"field_extra_field": "value"' in content
+
+
+def test_is_enabled_for_tracks_log_level(tmp_path):
+    logger = setup_logger(log_dir=tmp_path / "logs")
+
+    assert logger.is_enabled_for(LogLevel.INFO)
+    assert logger.is_enabled_for("debug")
+
+    logger.set_log_level(LogLevel.WARNING)
+
+    assert not logger.is_enabled_for(LogLevel.INFO)
+    assert logger.is_enabled_for(logging.ERROR)
+
+
+def test_lazy_args_are_formatted_only_when_emitted(tmp_path):
+    log_dir = tmp_path / "logs"
+    logger = setup_logger(log_dir=log_dir)
+
+    class Exploding:
+        def __str__(self):
+            raise AssertionError("formatted a suppressed record")
+
+    logger.set_log_level(LogLevel.INFO)
+    logger.debug("Suppressed %s", args=(Exploding(),))
+    logger.info("Added tab for module: %s", args=("nav_map",))
+
+    for handler in logger.logger.handlers:
+        handler.flush()
+
+    content = (log_dir / "huntpro.log").read_text(encoding="utf-8")
+    assert "Added tab for module: nav_map" in content
+    assert "Suppressed" not in content
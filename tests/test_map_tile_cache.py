@@ -2,13 +2,24 @@
 from __future__ import annotations
 
 import json
+import sqlite3
+import threading
+from contextlib import closing
 from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 
 from map_tile_cache import MapTileCache, TileFetchError, TileSource
 
 
+def _stored_manifest(cache_dir):
+    """Return the committed manifest rows as seen by another connection."""
+
+    with closing(sqlite3.connect(cache_dir / "tiles.db")) as db:
+        return {key: (source, last_updated) for key, source, last_updated in db.execute("SELECT * FROM tiles")}
+
+
 def test_get_tile_downloads_and_caches(tmp_path):
     """Tiles should be saved locally so future requests use the cache."""
 
@@ -23,13 +34,14 @@ def test_get_tile_downloads_and_caches(tmp_path):
 
     tile = cache.get_tile(12, 1234, 5678, "map")
     assert tile.source is TileSource.NETWORK
+    assert tile.path == tmp_path / "map" / "12" / "1234" / "5678.png"
     assert tile.path.read_bytes() == payload
     assert calls == [(12, 1234, 5678, "map")]
 
     # Manifest should record the download timestamp.
-    manifest = json.loads((tmp_path / "manifest.json").read_text())
-    entry = manifest[tile.key]
-    assert entry["source"] == TileSource.NETWORK.value
+    source, last_updated = _stored_manifest(tmp_path)[tile.key]
+    assert source == TileSource.NETWORK.value
+    assert last_updated == pytest.approx(tile.last_updated.timestamp())
 
     # A subsequent call should not hit the fetcher and should report the cache.
     calls.clear()
@@ -60,6 +72,10 @@ def test_get_tile_falls_back_when_fetch_fails(tmp_path):
     # Subsequent loads should continue to report the fallback source.
     second_tile = cache.get_tile(10, 100, 200, "map")
     assert second_tile.source is TileSource.FALLBACK
+    # All failed tiles share one placeholder file and stay out of the manifest.
+    assert cache.get_tile(10, 101, 200, "map").path == tile.path
+    cache.flush_manifest()
+    assert _stored_manifest(tmp_path) == {}
 
 
 @pytest.mark.parametrize(
@@ -75,3 +91,169 @@ def test_coordinate_to_tile(latitude, longitude, zoom, expected, tmp_path):
     x, y = cache.coordinate_to_tile(latitude, longitude, zoom)
     assert (x, y) == expected
 
+
+def test_get_tiles_downloads_misses_once_and_keeps_order(tmp_path):
+    calls = []
+
+    def fake_fetcher(zoom: int, x: int, y: int, mode: str):
+        calls.append((zoom, x, y, mode))
+        return f"{x}-{y}".encode()
+
+    cache = MapTileCache(cache_dir=tmp_path, tile_fetcher=fake_fetcher, max_workers=4)
+    cached = cache.get_tile(5, 0, 0, "map")
+    calls.clear()
+    assert _stored_manifest(tmp_path).keys() == {cached.key}
+
+    requests = [(5, 1, 0, "map"), (5, 0, 0, "Map"), (5, 2, 0, "map"), (5, 1, 0, "map")]
+    tiles = cache.get_tiles(requests)
+    cache.close()
+
+    assert [tile.key for tile in tiles] == ["map_5_1_0", cached.key, "map_5_2_0", "map_5_1_0"]
+    assert [tile.source for tile in tiles] == [
+        TileSource.NETWORK,
+        TileSource.CACHE,
+        TileSource.NETWORK,
+        TileSource.NETWORK,
+    ]
+    assert sorted(calls) == [(5, 1, 0, "map"), (5, 2, 0, "map")]
+    assert _stored_manifest(tmp_path).keys() == {"map_5_0_0", "map_5_1_0", "map_5_2_0"}
+
+
+def test_default_fetcher_reuses_one_connection(tmp_path):
+    peers = set()
+    agents = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):  # noqa: N802 - http.server API
+            peers.add(self.client_address)
+            agents.append(self.headers["User-Agent"])
+            body = self.path.encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        cache = MapTileCache(cache_dir=tmp_path)
+        cache.DEFAULT_TILE_SERVERS = {"map": f"http://127.0.0.1:{server.server_port}/{{z}}/{{x}}/{{y}}.png"}
+        tiles = [cache.get_tile(3, x, 1, "map") for x in range(3)]
+        cache.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert [tile.path.read_bytes() for tile in tiles] == [b"/3/0/1.png", b"/3/1/1.png", b"/3/2/1.png"]
+    assert len(peers) == 1
+    assert agents == [MapTileCache.USER_AGENT] * 3
+
+
+def test_manifest_writes_are_deferred_until_flush(tmp_path):
+    cache = MapTileCache(cache_dir=tmp_path, tile_fetcher=lambda *args: b"x")
+
+    cache.get_tile(4, 1, 1, "map")
+    cache.get_tile(4, 2, 1, "map")
+    cache.get_tile(4, 3, 1, "map")
+
+    assert len(_stored_manifest(tmp_path)) == 1
+    cache.flush_manifest()
+    assert len(_stored_manifest(tmp_path)) == 3
+
+
+def test_legacy_manifest_and_flat_tiles_are_migrated(tmp_path):
+    (tmp_path / "map_6_1_2.png").write_bytes(b"old")
+    (tmp_path / "manifest.json").write_text(
+        json.dumps({"map_6_1_2": {"source": "fallback", "last_updated": "2024-05-01T12:00:00"}})
+    )
+
+    cache = MapTileCache(cache_dir=tmp_path, tile_fetcher=lambda *args: b"new")
+    tile = cache.get_tile(6, 1, 2, "map")
+
+    assert not (tmp_path / "manifest.json").exists()
+    assert tile.path == tmp_path / "map" / "6" / "1" / "2.png"
+    assert tile.path.read_bytes() == b"old"
+    assert not (tmp_path / "map_6_1_2.png").exists()
+    assert tile.source is TileSource.FALLBACK
+    assert tile.last_updated == datetime(2024, 5, 1, 12, 0)
+
+
+def test_recent_tiles_are_served_from_memory(tmp_path, monkeypatch):
+    cache = MapTileCache(cache_dir=tmp_path, tile_fetcher=lambda *args: b"x")
+    cache.MEMORY_CACHE_SIZE = 2
+    first = cache.get_tile(8, 1, 1, "map")
+    cache.get_tile(8, 2, 1, "map")
+
+    def no_disk(*_args, **_kwargs):
+        raise AssertionError("recent tile looked up on disk")
+
+    monkeypatch.setattr(cache, "_tile_file", no_disk)
+    again = cache.get_tile(8, 1, 1, "map")
+    assert again.key == first.key
+    assert again.source is TileSource.CACHE
+    monkeypatch.undo()
+
+    # Adding a third tile evicts the least recently used one.
+    cache.get_tile(8, 3, 1, "map")
+    assert list(cache._recent_tiles) == [first.key, "map_8_3_1"]
+
+
+def test_coordinates_to_tiles_matches_single_conversion(tmp_path):
+    cache = MapTileCache(tile_fetcher=lambda *args: b"x", cache_dir=tmp_path)
+    points = [(0.0, 0.0), (37.7749, -122.4194), (51.5074, -0.1278), (-33.8688, 151.2093)]
+
+    xs, ys = cache.coordinates_to_tiles([lat for lat, _ in points], [lon for _, lon in points], 12)
+
+    assert list(zip(xs, ys)) == [cache.coordinate_to_tile(lat, lon, 12) for lat, lon in points]
+
+
+def test_failed_tile_is_retried_after_the_retry_interval(tmp_path, monkeypatch):
+    responses = [None, b"tile"]
+    calls = []
+
+    def flaky_fetcher(*args):
+        calls.append(args)
+        return responses.pop(0)
+
+    cache = MapTileCache(cache_dir=tmp_path, tile_fetcher=flaky_fetcher)
+    assert cache.get_tile(9, 4, 4, "map").source is TileSource.FALLBACK
+    assert cache.get_tile(9, 4, 4, "map").source is TileSource.FALLBACK
+    assert len(calls) == 1
+
+    monkeypatch.setattr(cache, "FALLBACK_RETRY_INTERVAL", 0.0)
+    tile = cache.get_tile(9, 4, 4, "map")
+    assert tile.source is TileSource.NETWORK
+    assert tile.path.read_bytes() == b"tile"
+
+
+def test_concurrent_requests_for_one_tile_share_a_download(tmp_path):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_fetcher(*args):
+        calls.append(args)
+        started.set()
+        release.wait(5)
+        return b"tile"
+
+    cache = MapTileCache(cache_dir=tmp_path, tile_fetcher=slow_fetcher)
+    results = []
+    first = threading.Thread(target=lambda: results.append(cache.get_tile(7, 3, 3, "map")))
+    first.start()
+    assert started.wait(5)
+    second = threading.Thread(target=lambda: results.append(cache.get_tile(7, 3, 3, "map")))
+    second.start()
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    assert len(calls) == 1
+    assert [tile.path.read_bytes() for tile in results] == [b"tile", b"tile"]
+    assert not list(tmp_path.rglob("*.part"))
@@ -0,0 +1,49 @@
+"""Tests for the settings dialog profile presets."""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+
+import pytest
+
+from profile_presets import PROFILE_PRESET_MAP, PROFILE_PRESETS, match_profile_preset
+
+
+def _dialog_state(preset, **overrides):
+    state = {
+        "call_sign": "Falcon01",
+        **dataclasses.asdict(preset.general),
+        **dataclasses.asdict(preset.display),
+        "modules": dataclasses.asdict(preset.modules),
+    }
+    state.update(overrides)
+    return state
+
+
+@pytest.mark.parametrize("preset", PROFILE_PRESETS, ids=lambda preset: preset.key)
+def test_match_profile_preset_finds_each_preset(preset):
+    assert match_profile_preset(_dialog_state(preset)) == preset.key
+
+
+def test_match_profile_preset_rejects_edited_state():
+    preset = PROFILE_PRESET_MAP["euro_stalker"]
+
+    assert match_profile_preset(_dialog_state(preset, font_scale=115)) is None
+    assert match_profile_preset(_dialog_state(preset, modules={"ballistics": True})) is None
+
+
+def test_presets_are_immutable():
+    preset = PROFILE_PRESETS[0]
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        preset.general.log_retention = 1  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        PROFILE_PRESET_MAP["custom"] = preset  # type: ignore[index]
+
+
+def test_preset_strings_are_interned():
+    regions = {preset.general.primary_region for preset in PROFILE_PRESETS}
+
+    for region in regions:
+        assert region is sys.intern("".join(region))
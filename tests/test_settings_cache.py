@@ -0,0 +1,138 @@
+"""Tests for the in-memory settings cache."""
+
+from __future__ import annotations
+
+from settings_cache import CachedSettings
+
+
+class FakeSettings:
+    """Minimal stand-in for ``QSettings`` that records backend traffic."""
+
+    def __init__(self, values=None):
+        self.values = dict(values or {})
+        self.reads = []
+        self.writes = []
+        self.sync_count = 0
+        self.group = ""
+
+    def value(self, key, default=None, value_type=None):
+        if self.group:
+            key = f"{self.group}/{key}"
+        self.reads.append(key)
+        return self.values.get(key, default)
+
+    def setValue(self, key, value):  # noqa: N802 - mirrors QSettings
+        self.writes.append((key, value))
+        self.values[key] = value
+
+    def sync(self):
+        self.sync_count += 1
+
+    def beginGroup(self, prefix):  # noqa: N802 - mirrors QSettings
+        self.group = prefix
+
+    def childKeys(self):  # noqa: N802 - mirrors QSettings
+        prefix = f"{self.group}/"
+        children = [key[len(prefix):] for key in self.values if key.startswith(prefix)]
+        return [child for child in children if "/" not in child]
+
+    def endGroup(self):  # noqa: N802 - mirrors QSettings
+        self.group = ""
+
+
+def test_value_reads_backend_once_and_coerces_types():
+    backend = FakeSettings({"general/log_retention": "45", "general/auto_backup": "false"})
+    settings = CachedSettings(backend)
+
+    assert settings.value("general/log_retention", 30, int) == 45
+    assert settings.value("general/log_retention", 30, int) == 45
+    assert settings.value("general/auto_backup", True, bool) is False
+    assert settings.value("general/call_sign", "") == ""
+    assert backend.reads == ["general/log_retention", "general/auto_backup", "general/call_sign"]
+
+
+def test_flush_only_writes_changed_keys():
+    backend = FakeSettings({"display/theme": "Dark"})
+    settings = CachedSettings(backend)
+    settings.value("display/theme")
+
+    settings.setValue("display/theme", "Dark")
+    assert not settings.is_dirty()
+    assert settings.flush() == 0
+    assert backend.sync_count == 0
+
+    settings.setValue("display/theme", "Light")
+    settings.setValue("display/font_scale", 110)
+    settings.setValue("display/font_scale", 115)
+
+    assert settings.flush() == 2
+    assert backend.writes == [("display/font_scale", 115), ("display/theme", "Light")]
+    assert backend.sync_count == 1
+    assert not settings.is_dirty()
+
+
+def test_take_changes_hands_off_without_touching_backend():
+    backend = FakeSettings()
+    settings = CachedSettings(backend)
+    settings.setValue("modules/nav_map", False)
+
+    assert settings.take_changes() == {"modules/nav_map": False}
+    assert settings.take_changes() == {}
+    assert backend.writes == []
+    # The cached value is still visible to readers of the wrapper.
+    assert settings.value("modules/nav_map", True, bool) is False
+
+
+def test_group_view_prefixes_backend_keys():
+    backend = FakeSettings({"module/Ballistics/temperature": 21})
+    settings = CachedSettings(backend, group="module/Ballistics")
+
+    assert settings.value("temperature", 15, int) == 21
+    settings.setValue("humidity", 40)
+    settings.flush()
+
+    assert backend.reads == ["module/Ballistics/temperature"]
+    assert backend.writes == [("module/Ballistics/humidity", 40)]
+
+
+def test_begin_group_resolves_nested_keys():
+    backend = FakeSettings({"general/call_sign": "Falcon01"})
+    settings = CachedSettings(backend)
+
+    settings.beginGroup("general")
+    assert settings.value("call_sign", "") == "Falcon01"
+    settings.setValue("show_tips", False)
+    settings.endGroup()
+
+    assert settings.value("general/show_tips", True, bool) is False
+    assert settings.take_changes() == {"general/show_tips": False}
+
+
+def test_set_value_ignores_string_copies_of_the_same_value():
+    backend = FakeSettings({"general/log_retention": "30", "general/auto_backup": "true"})
+    settings = CachedSettings(backend)
+    settings.value("general/log_retention")
+    settings.value("general/auto_backup")
+
+    settings.setValue("general/log_retention", 30)
+    settings.setValue("general/auto_backup", True)
+    assert not settings.is_dirty()
+
+    settings.setValue("general/log_retention", 45)
+    assert settings.take_changes() == {"general/log_retention": 45}
+
+
+def test_preload_reads_a_group_once_and_answers_missing_keys_from_memory():
+    backend = FakeSettings({"display/theme": "Light", "display/font_scale": "110", "general/call_sign": "A"})
+    settings = CachedSettings(backend)
+    settings.setValue("display/theme", "Dark")
+
+    settings.preload("display")
+    backend.reads.clear()
+
+    assert settings.value("display/theme") == "Dark"
+    assert settings.value("display/font_scale", 100, int) == 110
+    assert settings.value("display/high_contrast", False, bool) is False
+    assert backend.reads == []
+    assert settings.value("general/call_sign") == "A"
+    assert backend.reads == ["general/call_sign"]